@@ -7,34 +7,65 @@ Handles code-based technical challenges with:
 - Database schema questions
 - Live code execution and testing
 - Test case generation and validation
+
+Public names are resolved lazily on first access so that importing a single
+submodule (e.g. ``coding_interview.routes``) does not pull in the others.
 """
 
-from .routes import coding_bp
-from .question_generator import (
-    generate_coding_question,
-    CodingInterviewState,
-    InterviewQuestion,
-    DebugCodingQuestion,
-    ExplanationCodingQuestion,
-    DatabaseSchemaQuestion
-)
-from .job_skill_analyzer import (
-    analyze_job_description_skills,
-    JobSkillAnalysis,
-    SkillImportance
-)
-from .evaluator import (
-    evaluate_coding_interview,
-    EvaluationResult
-)
-from .utils import (
-    parse_coding_response,
-    calculate_coding_progress,
-    format_test_results,
-    generate_coding_filename
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .routes import coding_bp
+    from .question_generator import (
+        generate_coding_question,
+        CodingInterviewState,
+        InterviewQuestion,
+        DebugCodingQuestion,
+        ExplanationCodingQuestion,
+        DatabaseSchemaQuestion
+    )
+    from .job_skill_analyzer import (
+        analyze_job_description_skills,
+        analyze_job_descriptions_batch,
+        JobSkillAnalysis,
+        SkillImportance
+    )
+    from .evaluator.engine import evaluate_coding_interview, EvaluationResult
+    from .utils import (
+        parse_coding_response,
+        calculate_coding_progress,
+        format_test_results,
+        generate_coding_filename
+    )
+
+# Maps each exported name to the submodule that defines it
+_LAZY = {
+    # Blueprint
+    'coding_bp': '.routes',
+    # Question generation
+    'generate_coding_question': '.question_generator',
+    'CodingInterviewState': '.question_generator',
+    'InterviewQuestion': '.question_generator',
+    'DebugCodingQuestion': '.question_generator',
+    'ExplanationCodingQuestion': '.question_generator',
+    'DatabaseSchemaQuestion': '.question_generator',
+    # Job skill analysis
+    'analyze_job_description_skills': '.job_skill_analyzer',
+    'analyze_job_descriptions_batch': '.job_skill_analyzer',
+    'JobSkillAnalysis': '.job_skill_analyzer',
+    'SkillImportance': '.job_skill_analyzer',
+    # Evaluation
+    'evaluate_coding_interview': '.evaluator.engine',
+    'EvaluationResult': '.evaluator.engine',
+    # Utilities
+    'parse_coding_response': '.utils',
+    'calculate_coding_progress': '.utils',
+    'format_test_results': '.utils',
+    'generate_coding_filename': '.utils'
+}
 
-__all__ = [
+__all__ = (
     # Blueprint
     'coding_bp',
     # Question generation
@@ -46,6 +77,7 @@ __all__ = [
     'DatabaseSchemaQuestion',
     # Job skill analysis
     'analyze_job_description_skills',
+    'analyze_job_descriptions_batch',
     'JobSkillAnalysis',
     'SkillImportance',
     # Evaluation
@@ -56,4 +88,19 @@ __all__ = [
     'calculate_coding_progress',
     'format_test_results',
     'generate_coding_filename'
-]
+)
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access and cache it"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
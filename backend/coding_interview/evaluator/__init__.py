@@ -6,18 +6,59 @@ Handles evaluation of coding solutions:
 - Test case validation
 - Code quality assessment
 - Performance analysis
+
+Public names are resolved lazily on first access (see ``coding_interview``).
 """
 
-from .engine import evaluate_coding_interview, EvaluationResult
-from .piston_compiler import execute_code, run_test_cases, compare_buggy_vs_fixed
-from .output_comparator import compare_outputs, ExecutionComparison
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import evaluate_coding_interview, EvaluationResult
+    from .piston_compiler import (
+        execute_code, aexecute_code, run_test_cases, arun_test_cases,
+        compare_buggy_vs_fixed, acompare_buggy_vs_fixed
+    )
+    from .output_comparator import compare_outputs, ExecutionComparison
 
-__all__ = [
+# Maps each exported name to the submodule that defines it
+_LAZY = {
+    'evaluate_coding_interview': '.engine',
+    'EvaluationResult': '.engine',
+    'execute_code': '.piston_compiler',
+    'aexecute_code': '.piston_compiler',
+    'run_test_cases': '.piston_compiler',
+    'arun_test_cases': '.piston_compiler',
+    'compare_buggy_vs_fixed': '.piston_compiler',
+    'acompare_buggy_vs_fixed': '.piston_compiler',
+    'compare_outputs': '.output_comparator',
+    'ExecutionComparison': '.output_comparator'
+}
+
+__all__ = (
     'evaluate_coding_interview',
     'EvaluationResult',
     'execute_code',
+    'aexecute_code',
     'run_test_cases',
+    'arun_test_cases',
     'compare_buggy_vs_fixed',
+    'acompare_buggy_vs_fixed',
     'compare_outputs',
     'ExecutionComparison'
-]
+)
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access and cache it"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
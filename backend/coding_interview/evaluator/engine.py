@@ -3,21 +3,65 @@ Code Evaluator for Coding Interview Responses
 Orchestrates code compilation, testing, and LLM-based evaluation with scoring
 """
 
+import asyncio
 import json
+import logging
 import os
 import re
-import time
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 from pydantic import BaseModel, Field
 
+try:
+    import orjson  # Optional: faster parsing of judge responses
+except ImportError:
+    orjson = None
+
 # Import from shared modules
 from shared.llm_setup import get_llm
 
 # Import utilities
-from .piston_compiler import execute_code, run_test_cases, compare_buggy_vs_fixed
+from .piston_compiler import aexecute_code, acompare_buggy_vs_fixed
 from ..test_case_generator import load_test_cases, TestCaseSet
+from ..utils import fold_coding_response_log
 from .output_comparator import ExecutionComparison, compare_outputs
+from .judge_cache import JUDGE_CACHE_DIRNAME, make_judge_cache_key, load_cached_verdict, store_cached_verdict
+
+logger = logging.getLogger(__name__)
+
+_BANNER = "=" * 60
+
+# Maximum number of questions compiled/validated at once during an evaluation
+EVAL_CONCURRENCY = int(os.getenv('EVAL_CONCURRENCY', '4'))
+
+# Markdown fence an LLM may wrap around its JSON answer
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+
+# A db_schema answer without any of these is not sent to Piston
+_SQL_STATEMENT_RE = re.compile(r'\b(CREATE|ALTER|INSERT|SELECT)\b', re.IGNORECASE)
+
+# Title keywords used by detect_question_type()
+_TYPE_BY_KEYWORD = {
+    'debug': 'coding_debug',
+    'fix': 'coding_debug',
+    'bug': 'coding_debug',
+    'analysis': 'coding_explain',
+    'analyze': 'coding_explain',
+    'explain': 'coding_explain',
+    'database': 'db_schema',
+    'schema': 'db_schema',
+    'sql': 'db_schema'
+}
+_TYPE_KEYWORD_RE = re.compile('|'.join(_TYPE_BY_KEYWORD), re.IGNORECASE)
+
+# Section headers of the structured candidate response formats
+_SECTION_FLAGS = re.DOTALL | re.IGNORECASE
+_RE_DEBUG_CODE = re.compile(r'FIXED CODE:\s*\n(.*?)(?:\n\nEXPLANATION:|$)', _SECTION_FLAGS)
+_RE_DEBUG_EXPLANATION = re.compile(r'EXPLANATION:\s*\n(.*)', _SECTION_FLAGS)
+_RE_DB_SCHEMA = re.compile(r'SQL SCHEMA:\s*\n(.*?)(?:\n\nDESIGN EXPLANATION:|$)', _SECTION_FLAGS)
+_RE_DB_EXPLANATION = re.compile(r'DESIGN EXPLANATION:\s*\n(.*?)(?:\n\nEXAMPLE QUERIES:|$)', _SECTION_FLAGS)
+_RE_DB_QUERIES = re.compile(r'EXAMPLE QUERIES:\s*\n(.*)', _SECTION_FLAGS)
 
 
 class EvaluationResult(BaseModel):
@@ -50,63 +94,252 @@ def parse_candidate_response(response_text: str, question_type: str) -> Dict[str
     Returns:
         Dict with parsed components: {code: str, explanation: str, queries: str}
     """
-    if question_type == 'coding_debug':
-        # Parse debug response format: "FIXED CODE:\n{code}\n\nEXPLANATION:\n{explanation}"
-        code_match = re.search(r'FIXED CODE:\s*\n(.*?)(?:\n\nEXPLANATION:|$)', response_text, re.DOTALL | re.IGNORECASE)
-        explanation_match = re.search(r'EXPLANATION:\s*\n(.*)', response_text, re.DOTALL | re.IGNORECASE)
+    # Copy so callers never mutate the memoized result
+    return dict(_parse_candidate_response(response_text, question_type))
 
-        code = code_match.group(1).strip() if code_match else response_text.strip()
-        explanation = explanation_match.group(1).strip() if explanation_match else ""
 
-        return {
-            'code': code,
-            'explanation': explanation,
-            'queries': ''
-        }
+@lru_cache(maxsize=256)
+def _parse_candidate_response(response_text: str, question_type: str) -> Dict[str, str]:
+    """Memoized implementation of parse_candidate_response()"""
+    # Fallback: return entire response as code
+    parser = _RESPONSE_PARSERS.get(question_type, _parse_code_response)
+    return parser(response_text)
 
-    elif question_type == 'coding_explain':
-        # For explanation questions, the entire response is the analysis
-        return {
-            'code': '',
-            'explanation': response_text.strip(),
-            'queries': ''
-        }
 
-    elif question_type == 'db_schema':
-        # Parse DB schema format: "SQL SCHEMA:\n{schema}\n\nDESIGN EXPLANATION:\n{explanation}\n\nEXAMPLE QUERIES:\n{queries}"
-        schema_match = re.search(r'SQL SCHEMA:\s*\n(.*?)(?:\n\nDESIGN EXPLANATION:|$)', response_text, re.DOTALL | re.IGNORECASE)
-        explanation_match = re.search(r'DESIGN EXPLANATION:\s*\n(.*?)(?:\n\nEXAMPLE QUERIES:|$)', response_text, re.DOTALL | re.IGNORECASE)
-        queries_match = re.search(r'EXAMPLE QUERIES:\s*\n(.*)', response_text, re.DOTALL | re.IGNORECASE)
+def _parse_debug_response(response_text: str) -> Dict[str, str]:
+    """Parse debug response format: FIXED CODE / EXPLANATION sections"""
+    code_match = _RE_DEBUG_CODE.search(response_text)
+    explanation_match = _RE_DEBUG_EXPLANATION.search(response_text)
 
-        # Fallback: if structured format not found, treat entire response as schema
-        schema = schema_match.group(1).strip() if schema_match else response_text.strip()
-        explanation = explanation_match.group(1).strip() if explanation_match else ""
-        queries = queries_match.group(1).strip() if queries_match else ""
+    code = code_match.group(1).strip() if code_match else response_text.strip()
+    explanation = explanation_match.group(1).strip() if explanation_match else ""
 
-        return {
-            'code': schema,
-            'explanation': explanation,
-            'queries': queries
-        }
+    return {
+        'code': code,
+        'explanation': explanation,
+        'queries': ''
+    }
 
-    else:
-        # Fallback: return entire response as code
-        return {
-            'code': response_text.strip(),
-            'explanation': '',
-            'queries': ''
-        }
+
+def _parse_explain_response(response_text: str) -> Dict[str, str]:
+    """For explanation questions, the entire response is the analysis"""
+    return {
+        'code': '',
+        'explanation': response_text.strip(),
+        'queries': ''
+    }
 
 
-def evaluate_with_llm(
+def _parse_db_schema_response(response_text: str) -> Dict[str, str]:
+    """Parse DB schema format: SQL SCHEMA / DESIGN EXPLANATION / EXAMPLE QUERIES sections"""
+    schema_match = _RE_DB_SCHEMA.search(response_text)
+    explanation_match = _RE_DB_EXPLANATION.search(response_text)
+    queries_match = _RE_DB_QUERIES.search(response_text)
+
+    # Fallback: if structured format not found, treat entire response as schema
+    schema = schema_match.group(1).strip() if schema_match else response_text.strip()
+    explanation = explanation_match.group(1).strip() if explanation_match else ""
+    queries = queries_match.group(1).strip() if queries_match else ""
+
+    return {
+        'code': schema,
+        'explanation': explanation,
+        'queries': queries
+    }
+
+
+def _parse_code_response(response_text: str) -> Dict[str, str]:
+    """Treat the entire response as code"""
+    return {
+        'code': response_text.strip(),
+        'explanation': '',
+        'queries': ''
+    }
+
+
+_RESPONSE_PARSERS = {
+    'coding_debug': _parse_debug_response,
+    'coding_explain': _parse_explain_response,
+    'db_schema': _parse_db_schema_response
+}
+
+
+# Judge prompt building blocks. Preamble, rubrics and answer format are
+# static and always come before the submission, so the prompt prefix stays
+# byte-identical between calls; only the rubric for the question type being
+# judged is included.
+JUDGE_PREAMBLE = "You are evaluating a candidate's coding interview response. Be objective and constructive."
+
+RUBRIC_DEBUG = """**CRITICAL: SEQUENTIAL EVALUATION PRIORITY FOR DEBUG QUESTIONS:**
+
+**1. OUTPUT CORRECTNESS (Primary - This determines max possible score):**
+   - **EXECUTION_ERROR** → Code has runtime/syntax errors → **MAX SCORE = 2**
+     - Score 2: Has errors but explanation shows some understanding
+     - Score 1: Has errors with poor explanation
+     - Score 0: Complete failure
+
+   - **NO_MATCH** → Wrong output produced → **MAX SCORE = 3**
+     - Score 3: Wrong output but explanation shows understanding of what was needed
+     - Score 2: Wrong output with limited understanding
+     - Score 1: Wrong output and poor explanation
+
+   - **PARTIAL_MATCH** → Partially correct output → **MAX SCORE = 6**
+     - Score 6: Output mostly correct + good explanation
+     - Score 5: Output partially correct + adequate explanation
+     - Score 4: Output partially correct + weak explanation
+
+   - **EXACT_MATCH** → Perfect output → **FULL RANGE 7-10**
+     - Score 9-10: Perfect output + excellent explanation + optimal code quality
+     - Score 8: Perfect output + good explanation + decent code
+     - Score 7: Perfect output + minimal but correct explanation
+
+**2. EXPLANATION QUALITY (Secondary - Only matters if output is correct):**
+   - Did they identify the actual bugs correctly?
+   - Did they explain why the bugs caused incorrect behavior?
+   - Did they explain their fix properly?
+
+**3. CODE QUALITY (Tertiary - Only considered for EXACT_MATCH):**
+   - Code efficiency and best practices
+   - Error handling and edge cases
+   - Code readability and style"""
+
+RUBRIC_EXPLAIN = """**For Explain Questions:**
+- Focus on explanation quality, code understanding, and analysis depth
+- Output correctness is secondary (only if code includes test execution)
+- 9-10: Deep understanding, excellent complexity analysis, insightful improvements
+- 7-8: Good understanding, correct analysis, reasonable improvements
+- 5-6: Basic understanding, partial analysis, simple improvements
+- 3-4: Limited understanding, weak analysis
+- 0-2: Poor understanding, incorrect analysis"""
+
+RUBRIC_DB = """**For Database Questions:**
+- **Syntax Validation (Automatic):** Pass/Fail based on SQL execution
+- **Schema Design Evaluation (LLM):**
+  - 9-10: All requirements met, optimal design, proper normalization, appropriate constraints
+  - 7-8: Most requirements met, good design, minor improvements possible
+  - 5-6: Basic requirements met, design needs improvement, missing some constraints
+  - 3-4: Missing key requirements, poor design, major issues
+  - 0-2: Invalid syntax OR missing critical tables/columns
+
+**CRITICAL**: If SQL has syntax errors, max score = 2. LLM should verify:
+1. Are all required tables present?
+2. Are all required columns present with correct types?
+3. Are relationships (foreign keys) properly defined?
+4. Are constraints (PRIMARY KEY, UNIQUE, NOT NULL) appropriate?"""
+
+QUESTION_RUBRICS = {
+    'coding_debug': RUBRIC_DEBUG,
+    'coding_explain': RUBRIC_EXPLAIN,
+    'db_schema': RUBRIC_DB
+}
+
+BATCH_JUDGE_PREAMBLE = """You are evaluating a candidate's coding interview responses. Be objective and constructive.
+Evaluate each item independently."""
+
+JUDGE_TASK = """**YOUR TASK:**
+Provide EXACTLY 3 short feedback phrases (one sentence each) and a numerical score.
+
+**Return ONLY valid JSON in this exact format:**
+```json
+{
+  "score": 7,
+  "feedback": [
+    "First observation about what they did well",
+    "Main issue or area for improvement",
+    "Overall assessment or recommendation"
+  ]
+}
+```
+
+Return ONLY the JSON object, nothing else."""
+
+BATCH_JUDGE_TASK = """**YOUR TASK:**
+For EACH item, provide EXACTLY 3 short feedback phrases (one sentence each) and a numerical score.
+
+**Return ONLY a valid JSON array with one object per item, in this exact format:**
+```json
+[
+  {
+    "index": 0,
+    "score": 7,
+    "feedback": [
+      "First observation about what they did well",
+      "Main issue or area for improvement",
+      "Overall assessment or recommendation"
+    ]
+  }
+]
+```
+
+Return ONLY the JSON array, nothing else."""
+
+# Fills judge feedback up to the required 3 phrases
+_FEEDBACK_PADDING = ["Additional feedback needed"] * 3
+
+# Candidate code/explanations longer than this are truncated in judge prompts
+MAX_CODE_CHARS = 4000
+
+
+def build_evaluation_criteria(question_types: List[str]) -> str:
+    """
+    Assemble the scoring rubric for the given question types
+
+    Args:
+        question_types: Question types being judged (unknown types include every rubric)
+
+    Returns:
+        Rubric text starting with the "Evaluation Criteria" header
+    """
+    wanted = set(question_types)
+    if not wanted <= QUESTION_RUBRICS.keys():
+        wanted = set(QUESTION_RUBRICS)
+
+    sections = [rubric for question_type, rubric in QUESTION_RUBRICS.items() if question_type in wanted]
+    return "**Evaluation Criteria:**\n\n" + "\n\n".join(sections) + "\n"
+
+
+@lru_cache(maxsize=None)
+def build_judge_prefix(question_types: frozenset, batched: bool = False) -> str:
+    """
+    Build the static leading part of a judge prompt
+
+    Contains no submission data, so every call judging the same question
+    types sends a byte-identical prefix (provider prompt caching applies).
+
+    Args:
+        question_types: Question types being judged
+        batched: Use the multi-item instructions
+
+    Returns:
+        Preamble, rubric and answer format, to be followed by the submission(s)
+    """
+    preamble = BATCH_JUDGE_PREAMBLE if batched else JUDGE_PREAMBLE
+    task = BATCH_JUDGE_TASK if batched else JUDGE_TASK
+    return f"""
+{preamble}
+
+{build_evaluation_criteria(sorted(question_types))}
+{task}
+"""
+
+
+def truncate_for_prompt(text: str, limit: int = MAX_CODE_CHARS) -> str:
+    """Cut text to at most `limit` characters, marking the cut"""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "…[truncated]"
+
+
+def build_submission_summary(
     question_data: Dict[str, Any],
     candidate_response: Dict[str, str],
     compilation_results: Optional[Dict[str, Any]] = None,
     test_results: Optional[List[Dict[str, Any]]] = None,
-    execution_comparison: Optional[ExecutionComparison] = None
-) -> Tuple[int, List[str]]:
+    execution_comparison: Optional[ExecutionComparison] = None,
+    test_counts: Optional[Tuple[int, int]] = None
+) -> str:
     """
-    Use LLM to evaluate response and provide score + feedback
+    Render the question-specific part of a judge prompt
 
     Args:
         question_data: Original question details
@@ -114,9 +347,10 @@ def evaluate_with_llm(
         compilation_results: Results from code compilation (optional)
         test_results: Results from test cases (optional)
         execution_comparison: Structured comparison of expected vs actual output (optional)
+        test_counts: Precomputed (passed, total) for test_results (optional)
 
     Returns:
-        Tuple of (score: int, feedback: List[str])
+        Markdown block describing the question, the response and its execution results
     """
     question_type = question_data.get('question_type', 'unknown')
     question_text = question_data.get('question_text', '')
@@ -131,12 +365,20 @@ def evaluate_with_llm(
             compilation_summary = f"Code compiled and tested: {passed}/{total} test cases passed"
             if fixed.get('compilation_error'):
                 compilation_summary += " (compilation errors present)"
+        elif 'valid_syntax' in compilation_results:
+            # SQL validation (db_schema questions)
+            compilation_summary = f"SQL syntax valid: {compilation_results['valid_syntax']}"
+            if compilation_results.get('error'):
+                compilation_summary += f" ({compilation_results['error']})"
         else:
             compilation_summary = f"Compilation success: {compilation_results.get('success', False)}"
 
     # Build test results summary
     test_summary = "No test results"
-    if test_results:
+    if test_counts and test_counts[1]:
+        passed, total = test_counts
+        test_summary = f"{passed}/{total} tests passed"
+    elif test_results:
         passed = sum(1 for t in test_results if t.get('passed', False))
         total = len(test_results)
         test_summary = f"{passed}/{total} tests passed"
@@ -156,213 +398,417 @@ Compilation Success: {'Yes' if execution_comparison.compilation_success else 'No
 Notes: {execution_comparison.comparison_notes}
 """
 
-    prompt = f"""
-You are evaluating a candidate's coding interview response. Be objective and constructive.
-
-**Question Type:** {question_type}
+    return f"""**Question Type:** {question_type}
 **Question:** {question_text}
 
 **Candidate's Code/Response:**
-{candidate_response.get('code', 'N/A')}
+{truncate_for_prompt(candidate_response.get('code', 'N/A'))}
 
 **Candidate's Explanation:**
-{candidate_response.get('explanation', 'N/A')}
+{truncate_for_prompt(candidate_response.get('explanation', 'N/A'))}
 
 **Compilation Results:**
 {compilation_summary}
 
 **Test Results:**
-{test_summary}{execution_summary}
+{test_summary}{execution_summary}"""
 
-**Evaluation Criteria:**
 
-**CRITICAL: SEQUENTIAL EVALUATION PRIORITY FOR DEBUG QUESTIONS:**
+def strip_code_fences(llm_output: str) -> str:
+    """Remove the markdown code fence an LLM may wrap around its JSON answer"""
+    return _FENCE_RE.sub('', llm_output)
 
-**1. OUTPUT CORRECTNESS (Primary - This determines max possible score):**
-   - **EXECUTION_ERROR** → Code has runtime/syntax errors → **MAX SCORE = 2**
-     - Score 2: Has errors but explanation shows some understanding
-     - Score 1: Has errors with poor explanation
-     - Score 0: Complete failure
 
-   - **NO_MATCH** → Wrong output produced → **MAX SCORE = 3**
-     - Score 3: Wrong output but explanation shows understanding of what was needed
-     - Score 2: Wrong output with limited understanding
-     - Score 1: Wrong output and poor explanation
+def parse_llm_json(llm_output: str) -> Any:
+    """
+    Parse a (possibly fenced) JSON answer from the LLM
 
-   - **PARTIAL_MATCH** → Partially correct output → **MAX SCORE = 6**
-     - Score 6: Output mostly correct + good explanation
-     - Score 5: Output partially correct + adequate explanation
-     - Score 4: Output partially correct + weak explanation
+    Uses orjson when installed, stdlib json otherwise. Both raise
+    json.JSONDecodeError (orjson's error subclasses it) on invalid input.
+    """
+    cleaned = strip_code_fences(llm_output)
+    if orjson is not None:
+        return orjson.loads(cleaned)
+    return json.loads(cleaned)
 
-   - **EXACT_MATCH** → Perfect output → **FULL RANGE 7-10**
-     - Score 9-10: Perfect output + excellent explanation + optimal code quality
-     - Score 8: Perfect output + good explanation + decent code
-     - Score 7: Perfect output + minimal but correct explanation
 
-**2. EXPLANATION QUALITY (Secondary - Only matters if output is correct):**
-   - Did they identify the actual bugs correctly?
-   - Did they explain why the bugs caused incorrect behavior?
-   - Did they explain their fix properly?
+def rule_based_verdict(
+    candidate_response: Dict[str, str],
+    execution_comparison: Optional[ExecutionComparison] = None
+) -> Optional[Tuple[int, List[str]]]:
+    """
+    Score failing debug submissions without calling the LLM
 
-**3. CODE QUALITY (Tertiary - Only considered for EXACT_MATCH):**
-   - Code efficiency and best practices
-   - Error handling and edge cases
-   - Code readability and style
+    EXECUTION_ERROR and NO_MATCH results are capped at 2 and 3 by
+    apply_scoring_rules() whatever the LLM says, so they are scored directly:
+    the cap when an explanation is given, one less without one, 0 without code.
+    Set FORCE_LLM=1 to send them to the judge anyway.
 
-**For Explain Questions:**
-- Focus on explanation quality, code understanding, and analysis depth
-- Output correctness is secondary (only if code includes test execution)
-- 9-10: Deep understanding, excellent complexity analysis, insightful improvements
-- 7-8: Good understanding, correct analysis, reasonable improvements
-- 5-6: Basic understanding, partial analysis, simple improvements
-- 3-4: Limited understanding, weak analysis
-- 0-2: Poor understanding, incorrect analysis
+    Args:
+        candidate_response: Parsed candidate response
+        execution_comparison: Structured comparison of expected vs actual output (optional)
 
-**For Database Questions:**
-- **Syntax Validation (Automatic):** Pass/Fail based on SQL execution
-- **Schema Design Evaluation (LLM):**
-  - 9-10: All requirements met, optimal design, proper normalization, appropriate constraints
-  - 7-8: Most requirements met, good design, minor improvements possible
-  - 5-6: Basic requirements met, design needs improvement, missing some constraints
-  - 3-4: Missing key requirements, poor design, major issues
-  - 0-2: Invalid syntax OR missing critical tables/columns
+    Returns:
+        Tuple of (score, feedback), or None when the LLM judge is needed
+    """
+    if execution_comparison is None or os.getenv('FORCE_LLM', '').strip().lower() in ('1', 'true', 'yes'):
+        return None
+
+    match_status = execution_comparison.match_status
+    if match_status == "EXECUTION_ERROR":
+        cap = 2
+        feedback = [
+            f"Code has execution errors: {execution_comparison.comparison_notes[:80]}",
+            "Resolve the syntax/runtime issues before refining the logic",
+            "Run the fixed code locally to verify it executes"
+        ]
+    elif match_status == "NO_MATCH":
+        cap = 3
+        feedback = [
+            f"Output is incorrect: expected '{execution_comparison.expected_output[:50]}...', got '{execution_comparison.actual_output[:50]}...'",
+            "The fix does not produce the expected result",
+            "Trace the code against the expected output to find the remaining bug"
+        ]
+    else:
+        return None
 
-**CRITICAL**: If SQL has syntax errors, max score = 2. LLM should verify:
-1. Are all required tables present?
-2. Are all required columns present with correct types?
-3. Are relationships (foreign keys) properly defined?
-4. Are constraints (PRIMARY KEY, UNIQUE, NOT NULL) appropriate?
+    if not candidate_response.get('code', '').strip():
+        score = 0
+    elif candidate_response.get('explanation', '').strip():
+        score = cap
+    else:
+        score = cap - 1
 
-**YOUR TASK:**
-Provide EXACTLY 3 short feedback phrases (one sentence each) and a numerical score.
+    logger.debug("[SCORING] %s: scored %d without LLM judge", match_status, score)
+    return score, feedback
 
-**Return ONLY valid JSON in this exact format:**
-```json
-{{
-  "score": 7,
-  "feedback": [
-    "First observation about what they did well",
-    "Main issue or area for improvement",
-    "Overall assessment or recommendation"
-  ]
-}}
-```
 
-Return ONLY the JSON object, nothing else.
+def apply_scoring_rules(
+    score: int,
+    feedback: List[str],
+    execution_comparison: Optional[ExecutionComparison] = None
+) -> Tuple[int, List[str]]:
+    """
+    Clamp an LLM verdict and enforce the output-based score caps
+
+    Args:
+        score: Raw score returned by the LLM
+        feedback: Raw feedback phrases returned by the LLM
+        execution_comparison: Structured comparison of expected vs actual output (optional)
+
+    Returns:
+        Tuple of (score: int, feedback: List[str]) with exactly 3 feedback phrases
+    """
+    # Validate score range
+    score = max(0, min(10, score))
+
+    # Ensure exactly 3 feedback phrases (before the caps below rewrite feedback[0])
+    feedback = (list(feedback) + _FEEDBACK_PADDING)[:3]
+
+    # STRICT OUTPUT-BASED SCORING: Apply hard caps based on match_status
+    # This ensures output correctness is the primary factor for debug questions
+    if execution_comparison:
+        original_score = score
+        match_status = execution_comparison.match_status
+
+        if match_status == "EXECUTION_ERROR":
+            # Code has syntax/runtime errors - max score 2/10
+            if score > 2:
+                logger.debug("[SCORING] Score capped from %d to 2 due to EXECUTION_ERROR (code has runtime/syntax errors)", original_score)
+                score = min(score, 2)
+                # Update feedback to reflect the error
+                if "runtime error" not in feedback[0].lower() and "syntax error" not in feedback[0].lower():
+                    feedback[0] = f"Code has execution errors: {execution_comparison.comparison_notes[:80]}"
+
+        elif match_status == "NO_MATCH":
+            # Wrong output - max score 3/10
+            if score > 3:
+                logger.debug("[SCORING] Score capped from %d to 3 due to NO_MATCH (wrong output produced)", original_score)
+                score = min(score, 3)
+                # Update feedback to reflect incorrect output
+                if "output" not in feedback[0].lower() or "correct" in feedback[0].lower():
+                    feedback[0] = f"Output is incorrect: expected '{execution_comparison.expected_output[:50]}...', got '{execution_comparison.actual_output[:50]}...'"
+
+        elif match_status == "PARTIAL_MATCH":
+            # Partially correct output - max score 6/10
+            if score > 6:
+                logger.debug("[SCORING] Score capped from %d to 6 due to PARTIAL_MATCH (output partially correct)", original_score)
+                score = min(score, 6)
+
+        # EXACT_MATCH: No cap, allow full range 7-10 based on explanation and code quality
+        elif match_status == "EXACT_MATCH":
+            # Ensure minimum score of 7 for perfect output
+            if score < 7:
+                logger.debug("[SCORING] Score bumped from %d to 7 due to EXACT_MATCH (perfect output)", original_score)
+                score = max(score, 7)
+
+    return score, feedback
+
+
+async def aevaluate_with_llm(
+    question_data: Dict[str, Any],
+    candidate_response: Dict[str, str],
+    compilation_results: Optional[Dict[str, Any]] = None,
+    test_results: Optional[List[Dict[str, Any]]] = None,
+    execution_comparison: Optional[ExecutionComparison] = None,
+    test_counts: Optional[Tuple[int, int]] = None,
+    cache_dir: Optional[str] = None
+) -> Tuple[int, List[str]]:
+    """
+    Use LLM to evaluate response and provide score + feedback
+
+    Args:
+        question_data: Original question details
+        candidate_response: Parsed candidate response
+        compilation_results: Results from code compilation (optional)
+        test_results: Results from test cases (optional)
+        execution_comparison: Structured comparison of expected vs actual output (optional)
+        test_counts: Precomputed (passed, total) for test_results (optional)
+        cache_dir: Judge verdict cache directory (optional, see judge_cache)
+
+    Returns:
+        Tuple of (score: int, feedback: List[str])
+    """
+    # Failing executions are scored by fixed rules, no judge needed
+    rule_verdict = rule_based_verdict(candidate_response, execution_comparison)
+    if rule_verdict is not None:
+        return rule_verdict
+
+    submission_summary = build_submission_summary(
+        question_data,
+        candidate_response,
+        compilation_results=compilation_results,
+        test_results=test_results,
+        execution_comparison=execution_comparison,
+        test_counts=test_counts
+    )
+
+    # Identical submissions always get the same verdict, reuse it if stored
+    evaluation_criteria = build_evaluation_criteria([question_data.get('question_type', 'unknown')])
+    cache_key = make_judge_cache_key(evaluation_criteria, submission_summary)
+    cached_verdict = load_cached_verdict(cache_dir, cache_key)
+    if cached_verdict is not None:
+        logger.info("[INFO] Reusing cached judge verdict")
+        return cached_verdict
+
+    # Static prefix first, submission last
+    prompt = build_judge_prefix(frozenset([question_data.get('question_type', 'unknown')])) + f"""
+**SUBMISSION TO EVALUATE:**
+
+{submission_summary}
 """
 
     try:
         llm = get_llm()
-        response = llm.invoke(prompt)
-        evaluation_json = response.content.strip()
-
-        # Clean response
-        if evaluation_json.startswith("```json"):
-            evaluation_json = evaluation_json.replace("```json", "").replace("```", "").strip()
-        elif evaluation_json.startswith("```"):
-            evaluation_json = evaluation_json.replace("```", "").strip()
+        response = await asyncio.to_thread(llm.invoke, prompt)
 
         # Parse JSON
-        evaluation_data = json.loads(evaluation_json)
+        evaluation_data = parse_llm_json(response.content)
         score = evaluation_data.get('score', 5)
         feedback = evaluation_data.get('feedback', [])
 
-        # Validate score range
-        score = max(0, min(10, score))
-
-        # STRICT OUTPUT-BASED SCORING: Apply hard caps based on match_status
-        # This ensures output correctness is the primary factor for debug questions
-        if execution_comparison:
-            original_score = score
-            match_status = execution_comparison.match_status
-
-            if match_status == "EXECUTION_ERROR":
-                # Code has syntax/runtime errors - max score 2/10
-                if score > 2:
-                    print(f"[SCORING] Score capped from {original_score} to 2 due to EXECUTION_ERROR (code has runtime/syntax errors)")
-                    score = min(score, 2)
-                    # Update feedback to reflect the error
-                    if "runtime error" not in feedback[0].lower() and "syntax error" not in feedback[0].lower():
-                        feedback[0] = f"Code has execution errors: {execution_comparison.comparison_notes[:80]}"
-
-            elif match_status == "NO_MATCH":
-                # Wrong output - max score 3/10
-                if score > 3:
-                    print(f"[SCORING] Score capped from {original_score} to 3 due to NO_MATCH (wrong output produced)")
-                    score = min(score, 3)
-                    # Update feedback to reflect incorrect output
-                    if "output" not in feedback[0].lower() or "correct" in feedback[0].lower():
-                        feedback[0] = f"Output is incorrect: expected '{execution_comparison.expected_output[:50]}...', got '{execution_comparison.actual_output[:50]}...'"
-
-            elif match_status == "PARTIAL_MATCH":
-                # Partially correct output - max score 6/10
-                if score > 6:
-                    print(f"[SCORING] Score capped from {original_score} to 6 due to PARTIAL_MATCH (output partially correct)")
-                    score = min(score, 6)
-
-            # EXACT_MATCH: No cap, allow full range 7-10 based on explanation and code quality
-            elif match_status == "EXACT_MATCH":
-                # Ensure minimum score of 7 for perfect output
-                if score < 7:
-                    print(f"[SCORING] Score bumped from {original_score} to 7 due to EXACT_MATCH (perfect output)")
-                    score = max(score, 7)
-
-        # Ensure exactly 3 feedback phrases
-        if len(feedback) < 3:
-            feedback.extend(["Additional feedback needed"] * (3 - len(feedback)))
-        elif len(feedback) > 3:
-            feedback = feedback[:3]
-
+        score, feedback = apply_scoring_rules(score, feedback, execution_comparison)
+        store_cached_verdict(cache_dir, cache_key, score, feedback)
         return score, feedback
 
     except json.JSONDecodeError as e:
-        print(f"[ERROR] Failed to parse LLM evaluation: {e}")
+        logger.error("[ERROR] Failed to parse LLM evaluation: %s", e)
         return 5, ["Unable to parse evaluation", "Please review manually", "Default score assigned"]
 
     except Exception as e:
-        print(f"[ERROR] Error in LLM evaluation: {e}")
+        logger.error("[ERROR] Error in LLM evaluation: %s", e)
         return 5, ["Evaluation error occurred", "Please review manually", "Default score assigned"]
 
 
-def evaluate_debug_question(
+def evaluate_with_llm(
     question_data: Dict[str, Any],
-    candidate_response: str,
-    test_cases: Optional[TestCaseSet] = None
-) -> EvaluationResult:
+    candidate_response: Dict[str, str],
+    compilation_results: Optional[Dict[str, Any]] = None,
+    test_results: Optional[List[Dict[str, Any]]] = None,
+    execution_comparison: Optional[ExecutionComparison] = None,
+    test_counts: Optional[Tuple[int, int]] = None,
+    cache_dir: Optional[str] = None
+) -> Tuple[int, List[str]]:
+    """Synchronous wrapper around aevaluate_with_llm()"""
+    return asyncio.run(aevaluate_with_llm(
+        question_data,
+        candidate_response,
+        compilation_results=compilation_results,
+        test_results=test_results,
+        execution_comparison=execution_comparison,
+        test_counts=test_counts,
+        cache_dir=cache_dir
+    ))
+
+
+async def abatch_evaluate_with_llm(
+    judge_inputs: List[Dict[str, Any]],
+    cache_dir: Optional[str] = None
+) -> List[Tuple[int, List[str]]]:
     """
-    Evaluate a debug coding question
+    Evaluate several responses with a single LLM judge call
 
-    Process:
-    1. Parse fixed code from response
-    2. Compile buggy code (should fail/produce wrong output)
-    3. Compile fixed code (should pass test cases)
-    4. Compare outputs
-    5. LLM evaluates code quality
+    Failing executions (see rule_based_verdict()) and responses with a cached
+    verdict are not sent to the LLM. Items the batched
+    answer does not cover (bad JSON, missing index) are re-evaluated
+    individually with aevaluate_with_llm().
 
     Args:
-        question_data: Original question details
-        candidate_response: Candidate's response text
-        test_cases: Test cases for validation
+        judge_inputs: One dict of aevaluate_with_llm() keyword arguments per response
+        cache_dir: Judge verdict cache directory (optional, see judge_cache)
 
     Returns:
-        EvaluationResult object
+        List of (score, feedback) tuples in the same order as judge_inputs
+    """
+    summaries = [build_submission_summary(**inputs) for inputs in judge_inputs]
+    cache_keys = [
+        make_judge_cache_key(build_evaluation_criteria([inputs['question_data'].get('question_type', 'unknown')]), summary)
+        for inputs, summary in zip(judge_inputs, summaries)
+    ]
+
+    verdicts = {}
+    for index, inputs in enumerate(judge_inputs):
+        rule_verdict = rule_based_verdict(inputs['candidate_response'], inputs.get('execution_comparison'))
+        if rule_verdict is not None:
+            verdicts[index] = rule_verdict
+
+    cached_count = 0
+    for index, cache_key in enumerate(cache_keys):
+        if index in verdicts:
+            continue
+        cached_verdict = load_cached_verdict(cache_dir, cache_key)
+        if cached_verdict is not None:
+            verdicts[index] = cached_verdict
+            cached_count += 1
+    if cached_count:
+        logger.info("[INFO] Reusing %d cached judge verdict(s)", cached_count)
+
+    uncached = [index for index in range(len(judge_inputs)) if index not in verdicts]
+    if len(uncached) > 1:
+        await _ajudge_batch(judge_inputs, summaries, cache_keys, uncached, verdicts, cache_dir)
+
+    # One call per response for anything the batch did not cover
+    missing = [index for index in range(len(judge_inputs)) if index not in verdicts]
+    if missing:
+        if len(uncached) > 1:
+            logger.warning("[WARNING] %d response(s) missing from batched evaluation, judging individually", len(missing))
+        fallback_verdicts = await asyncio.gather(
+            *(aevaluate_with_llm(**judge_inputs[index], cache_dir=cache_dir) for index in missing)
+        )
+        verdicts.update(zip(missing, fallback_verdicts))
+
+    return [verdicts[index] for index in range(len(judge_inputs))]
+
+
+async def _ajudge_batch(
+    judge_inputs: List[Dict[str, Any]],
+    summaries: List[str],
+    cache_keys: List[str],
+    indices: List[int],
+    verdicts: Dict[int, Tuple[int, List[str]]],
+    cache_dir: Optional[str]
+) -> None:
+    """Send the responses at `indices` to the LLM in one prompt and record their verdicts"""
+    # Items are numbered 0..n-1 in the prompt; position maps back to judge_inputs
+    items = "\n\n".join(f"### Item {position}\n{summaries[index]}" for position, index in enumerate(indices))
+    question_types = frozenset(judge_inputs[index]['question_data'].get('question_type', 'unknown') for index in indices)
+
+    # Static prefix first, submissions last
+    prompt = build_judge_prefix(question_types, batched=True) + f"""
+**ITEMS TO EVALUATE:**
+
+{items}
+"""
+
+    try:
+        logger.info("[INFO] Judging %d responses in one LLM call...", len(indices))
+        llm = get_llm()
+        response = await asyncio.to_thread(llm.invoke, prompt)
+        batch_data = parse_llm_json(response.content)
+
+        for position, item in enumerate(batch_data):
+            try:
+                item_position = int(item.get('index', position))
+                index = indices[item_position] if 0 <= item_position < len(indices) else None
+                if index is not None and index not in verdicts:
+                    score, feedback = apply_scoring_rules(
+                        item.get('score', 5),
+                        item.get('feedback', []),
+                        judge_inputs[index].get('execution_comparison')
+                    )
+                    verdicts[index] = (score, feedback)
+                    store_cached_verdict(cache_dir, cache_keys[index], score, feedback)
+            except Exception as e:
+                logger.error("[ERROR] Invalid item in batched LLM evaluation: %s", e)
+
+    except json.JSONDecodeError as e:
+        logger.error("[ERROR] Failed to parse batched LLM evaluation: %s", e)
+
+    except Exception as e:
+        logger.error("[ERROR] Error in batched LLM evaluation: %s", e)
+
+
+def batch_evaluate_with_llm(
+    judge_inputs: List[Dict[str, Any]],
+    cache_dir: Optional[str] = None
+) -> List[Tuple[int, List[str]]]:
+    """Synchronous wrapper around abatch_evaluate_with_llm()"""
+    return asyncio.run(abatch_evaluate_with_llm(judge_inputs, cache_dir=cache_dir))
+
+
+def build_evaluation_result(prepared: Dict[str, Any], score: int, feedback: List[str]) -> EvaluationResult:
+    """Combine a prepared question (see the _aprepare_* helpers) with its LLM verdict"""
+    return EvaluationResult(
+        question_title=prepared['judge_inputs']['question_data'].get('question_text', 'Unknown'),
+        question_type=prepared['question_type'],
+        score=score,
+        feedback=feedback,
+        details=prepared['details']
+    )
+
+
+def build_error_result(question_title: str, question_type: str, error: Exception) -> EvaluationResult:
+    """Zero-score result recorded when a question cannot be evaluated"""
+    return EvaluationResult(
+        question_title=question_title,
+        question_type=question_type,
+        score=0,
+        feedback=[
+            "Evaluation failed due to error",
+            f"Error: {str(error)}",
+            "Manual review required"
+        ],
+        details={'error': str(error)}
+    )
+
+
+async def _aprepare_debug_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> Dict[str, Any]:
+    """
+    Run the non-LLM part of debug evaluation (parsing, compilation, output comparison)
+
+    Returns:
+        Dict with 'question_type', 'judge_inputs' (aevaluate_with_llm kwargs) and 'details'
     """
-    print(f"[DEBUG] Evaluating debug question: {question_data.get('question_text', 'Unknown')}")
+    logger.info("[DEBUG] Evaluating debug question: %s", question_data.get('question_text', 'Unknown'))
 
     # Parse response
     parsed_response = parse_candidate_response(candidate_response, 'coding_debug')
     fixed_code = parsed_response['code']
-    explanation = parsed_response['explanation']
 
     # Get buggy code and language from question
     buggy_code = question_data.get('buggy_code', '')
     language = question_data.get('target_language', 'python')
 
     evaluation_details = {}
+    judge_inputs = {'question_data': question_data, 'candidate_response': parsed_response}
 
     # If test cases available (DB questions), compile and test both versions
     if test_cases and test_cases.test_cases:
-        print(f"[INFO] Running code through {len(test_cases.test_cases)} test cases...")
+        logger.info("[INFO] Running code through %d test cases...", len(test_cases.test_cases))
 
         # Convert test cases to format expected by piston_compiler
         test_case_list = [
@@ -374,36 +820,29 @@ def evaluate_debug_question(
             for tc in test_cases.test_cases
         ]
 
-        # Rate limiting delay before compilation
-        time.sleep(0.3)
-
-        # Compare buggy vs fixed code
-        comparison = compare_buggy_vs_fixed(buggy_code, fixed_code, language, test_case_list)
+        # Compare buggy vs fixed code (both versions run concurrently)
+        comparison = await acompare_buggy_vs_fixed(buggy_code, fixed_code, language, test_case_list)
         evaluation_details['compilation'] = comparison
         evaluation_details['test_results'] = comparison['fixed_results']['test_results']
 
-        # Get score and feedback from LLM
-        score, feedback = evaluate_with_llm(
-            question_data,
-            parsed_response,
-            compilation_results=comparison,
-            test_results=comparison['fixed_results']['test_results']
+        judge_inputs['compilation_results'] = comparison
+        judge_inputs['test_results'] = comparison['fixed_results']['test_results']
+        judge_inputs['test_counts'] = (
+            comparison['fixed_results']['passed_count'],
+            comparison['fixed_results']['total_count']
         )
 
     else:
         # No test cases (coding questions): Use simple execution with embedded test data and compare outputs
-        print("🎯 Using embedded test data for code execution with output comparison...")
+        logger.info("🎯 Using embedded test data for code execution with output comparison...")
 
         expected_output = question_data.get('expected_output', '')
 
-        print(f"[INFO] Expected output: '{expected_output}'")
-
-        # Rate limiting delay before execution
-        time.sleep(0.3)
+        logger.info("[INFO] Expected output: '%s'", expected_output)
 
         try:
             # Execute the fixed code (test data is embedded in the code itself)
-            execution_result = execute_code(fixed_code, language, stdin='')
+            execution_result = await aexecute_code(fixed_code, language, stdin='')
 
             # Create structured comparison using output_comparator
             execution_comparison = compare_outputs(
@@ -416,100 +855,143 @@ def evaluate_debug_question(
             # Store comparison in evaluation details
             evaluation_details['execution_comparison'] = execution_comparison.model_dump()
 
-            print(f"[INFO] Match Status: {execution_comparison.match_status}")
-            print(f"[INFO] Confidence: {execution_comparison.match_confidence * 100:.1f}%")
-            print(f"[INFO] Expected: '{expected_output}'")
-            print(f"[INFO] Actual: '{execution_comparison.actual_output}'")
-
-            # Get score and feedback from LLM with structured comparison
-            score, feedback = evaluate_with_llm(
-                question_data,
-                parsed_response,
-                execution_comparison=execution_comparison
+            logger.info(
+                "[INFO] Match Status: %s\n[INFO] Confidence: %.1f%%\n[INFO] Expected: '%s'\n[INFO] Actual: '%s'",
+                execution_comparison.match_status, execution_comparison.match_confidence * 100,
+                expected_output, execution_comparison.actual_output
             )
 
+            # LLM judges with the structured comparison
+            judge_inputs['execution_comparison'] = execution_comparison
+
         except Exception as e:
-            print(f"[ERROR] Code execution error: {e}")
+            logger.error("[ERROR] Code execution error: %s", e)
             evaluation_details['execution_error'] = str(e)
             # Fallback to LLM-only evaluation
-            score, feedback = evaluate_with_llm(question_data, parsed_response)
             evaluation_details['note'] = "Execution failed - evaluated based on code review only"
 
-    return EvaluationResult(
-        question_title=question_data.get('question_text', 'Unknown'),
-        question_type='coding_debug',
-        score=score,
-        feedback=feedback,
-        details=evaluation_details
-    )
+    return {
+        'question_type': 'coding_debug',
+        'judge_inputs': judge_inputs,
+        'details': evaluation_details
+    }
 
 
-def evaluate_explain_question(
+async def aevaluate_debug_question(
     question_data: Dict[str, Any],
     candidate_response: str,
     test_cases: Optional[TestCaseSet] = None
 ) -> EvaluationResult:
     """
-    Evaluate a code explanation question
+    Evaluate a debug coding question
 
     Process:
-    1. Parse explanation from response
-    2. LLM evaluates explanation quality:
-       - Understanding of code functionality
-       - Complexity analysis accuracy
-       - Edge case identification
-       - Improvement suggestions
+    1. Parse fixed code from response
+    2. Compile buggy code (should fail/produce wrong output)
+    3. Compile fixed code (should pass test cases)
+    4. Compare outputs
+    5. LLM evaluates code quality
 
     Args:
         question_data: Original question details
         candidate_response: Candidate's response text
-        test_cases: Test cases (not used for explain questions)
+        test_cases: Test cases for validation
 
     Returns:
         EvaluationResult object
     """
-    print(f"[EXPLAIN] Evaluating explanation question: {question_data.get('question_text', 'Unknown')}")
+    prepared = await _aprepare_debug_question(question_data, candidate_response, test_cases)
+    score, feedback = await aevaluate_with_llm(**prepared['judge_inputs'])
+    return build_evaluation_result(prepared, score, feedback)
+
+
+def evaluate_debug_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> EvaluationResult:
+    """Synchronous wrapper around aevaluate_debug_question()"""
+    return asyncio.run(aevaluate_debug_question(question_data, candidate_response, test_cases))
+
+
+async def _aprepare_explain_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> Dict[str, Any]:
+    """
+    Run the non-LLM part of explanation evaluation (parsing only)
+
+    Returns:
+        Dict with 'question_type', 'judge_inputs' (aevaluate_with_llm kwargs) and 'details'
+    """
+    logger.info("[EXPLAIN] Evaluating explanation question: %s", question_data.get('question_text', 'Unknown'))
 
     # Parse response (entire response is the explanation)
     parsed_response = parse_candidate_response(candidate_response, 'coding_explain')
 
-    # LLM evaluation (no compilation for explain questions)
-    score, feedback = evaluate_with_llm(question_data, parsed_response)
-
-    return EvaluationResult(
-        question_title=question_data.get('question_text', 'Unknown'),
-        question_type='coding_explain',
-        score=score,
-        feedback=feedback,
-        details={
+    # LLM evaluation only (no compilation for explain questions)
+    return {
+        'question_type': 'coding_explain',
+        'judge_inputs': {'question_data': question_data, 'candidate_response': parsed_response},
+        'details': {
             'analysis_quality': 'LLM-evaluated based on understanding and insight',
             'explanation_length': len(parsed_response['explanation'])
         }
-    )
+    }
 
 
-def evaluate_db_schema_question(
+async def aevaluate_explain_question(
     question_data: Dict[str, Any],
     candidate_response: str,
     test_cases: Optional[TestCaseSet] = None
 ) -> EvaluationResult:
     """
-    Evaluate a database schema question
+    Evaluate a code explanation question
 
     Process:
-    1. Parse SQL schema from response
-    2. Validate SQL syntax using Piston (SQLite)
-    3. LLM evaluates (syntax validation only, not deep design)
+    1. Parse explanation from response
+    2. LLM evaluates explanation quality:
+       - Understanding of code functionality
+       - Complexity analysis accuracy
+       - Edge case identification
+       - Improvement suggestions
 
     Args:
         question_data: Original question details
         candidate_response: Candidate's response text
-        test_cases: Test cases for SQL validation
+        test_cases: Test cases (not used for explain questions)
 
     Returns:
         EvaluationResult object
     """
-    print(f"[DB] Evaluating database schema question: {question_data.get('question_text', 'Unknown')}")
+    prepared = await _aprepare_explain_question(question_data, candidate_response, test_cases)
+    score, feedback = await aevaluate_with_llm(**prepared['judge_inputs'])
+    return build_evaluation_result(prepared, score, feedback)
+
+
+def evaluate_explain_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> EvaluationResult:
+    """Synchronous wrapper around aevaluate_explain_question()"""
+    return asyncio.run(aevaluate_explain_question(question_data, candidate_response, test_cases))
+
+
+async def _aprepare_db_schema_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> Dict[str, Any]:
+    """
+    Run the non-LLM part of database schema evaluation (parsing, SQL syntax validation)
+
+    Returns:
+        Dict with 'question_type', 'judge_inputs' (aevaluate_with_llm kwargs) and 'details',
+        plus a final 'result' when no schema was submitted
+    """
+    logger.info("[DB] Evaluating database schema question: %s", question_data.get('question_text', 'Unknown'))
 
     # Parse response
     parsed_response = parse_candidate_response(candidate_response, 'db_schema')
@@ -517,58 +999,217 @@ def evaluate_db_schema_question(
 
     evaluation_details = {}
 
-    # Try to validate SQL syntax
-    if sql_schema.strip():
-        print("[INFO] Validating SQL syntax...")
-        time.sleep(0.3)  # Rate limiting
+    # Nothing to validate or judge: score directly
+    if not sql_schema.strip():
+        evaluation_details['sql_validation'] = {
+            'valid_syntax': False,
+            'error': 'No SQL schema provided'
+        }
+        return {
+            'question_type': 'db_schema',
+            'judge_inputs': {
+                'question_data': question_data,
+                'candidate_response': parsed_response,
+                'compilation_results': evaluation_details['sql_validation']
+            },
+            'details': evaluation_details,
+            'result': EvaluationResult(
+                question_title=question_data.get('question_text', 'Unknown'),
+                question_type='db_schema',
+                score=0,
+                feedback=[
+                    "No SQL schema provided",
+                    "Submit CREATE TABLE statements for the required tables",
+                    "Resubmission required for evaluation"
+                ],
+                details=evaluation_details
+            )
+        }
+
+    # Try to validate SQL syntax (skip Piston when there are no SQL statements at all)
+    if not _SQL_STATEMENT_RE.search(sql_schema):
+        logger.info("[INFO] No SQL statements detected, skipping syntax validation")
+        evaluation_details['sql_validation'] = {
+            'valid_syntax': False,
+            'error': 'No SQL statements detected (expected CREATE TABLE ...)'
+        }
+    else:
+        logger.info("[INFO] Validating SQL syntax...")
 
         # Execute SQL to check syntax (using SQLite)
-        result = execute_code(sql_schema, 'sql', stdin='')
+        result = await aexecute_code(sql_schema, 'sql', stdin='')
 
         evaluation_details['sql_validation'] = {
             'valid_syntax': result['success'] and result['exit_code'] == 0,
             'stderr': result.get('stderr', ''),
             'error': result.get('error', '') if not result['success'] else None
         }
-    else:
-        evaluation_details['sql_validation'] = {
-            'valid_syntax': False,
-            'error': 'No SQL schema provided'
-        }
 
-    # LLM evaluation
-    score, feedback = evaluate_with_llm(
-        question_data,
-        parsed_response,
-        compilation_results=evaluation_details.get('sql_validation')
-    )
+    return {
+        'question_type': 'db_schema',
+        'judge_inputs': {
+            'question_data': question_data,
+            'candidate_response': parsed_response,
+            'compilation_results': evaluation_details.get('sql_validation')
+        },
+        'details': evaluation_details
+    }
 
-    return EvaluationResult(
-        question_title=question_data.get('question_text', 'Unknown'),
-        question_type='db_schema',
-        score=score,
-        feedback=feedback,
-        details=evaluation_details
+
+async def aevaluate_db_schema_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> EvaluationResult:
+    """
+    Evaluate a database schema question
+
+    Process:
+    1. Parse SQL schema from response
+    2. Validate SQL syntax using Piston (SQLite)
+    3. LLM evaluates (syntax validation only, not deep design)
+
+    Args:
+        question_data: Original question details
+        candidate_response: Candidate's response text
+        test_cases: Test cases for SQL validation
+
+    Returns:
+        EvaluationResult object
+    """
+    prepared = await _aprepare_db_schema_question(question_data, candidate_response, test_cases)
+    if 'result' in prepared:
+        return prepared['result']
+    score, feedback = await aevaluate_with_llm(**prepared['judge_inputs'])
+    return build_evaluation_result(prepared, score, feedback)
+
+
+def evaluate_db_schema_question(
+    question_data: Dict[str, Any],
+    candidate_response: str,
+    test_cases: Optional[TestCaseSet] = None
+) -> EvaluationResult:
+    """Synchronous wrapper around aevaluate_db_schema_question()"""
+    return asyncio.run(aevaluate_db_schema_question(question_data, candidate_response, test_cases))
+
+
+# Preparation step per question type (same signature for all)
+_QUESTION_PREPARERS = {
+    'coding_debug': _aprepare_debug_question,
+    'coding_explain': _aprepare_explain_question,
+    'db_schema': _aprepare_db_schema_question
+}
+
+
+async def _aprepare_question(question_entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run compilation/validation for a single saved question entry
+
+    Args:
+        question_entry: One entry of the coding test file's 'questions' list
+
+    Returns:
+        Prepared question dict (see _aprepare_debug_question), or a dict with a
+        ready 'result' when the question could not be prepared
+    """
+    # Extract question data from structured format
+    question_id = question_entry.get('question_id', 0)
+    question_title = question_entry.get('question_title', 'Unknown Question')
+    question_type = question_entry.get('question_type', 'coding_debug')
+    technology = question_entry.get('technology', 'python')
+    response_text = question_entry.get('candidate_full_response', '')
+
+    logger.info(
+        "\n%s\nEvaluating Q%s: %s\n%s\nType: %s | Technology: %s",
+        _BANNER, question_id, question_title, _BANNER, question_type, technology
     )
 
+    # Build question data using structured info
+    question_data = {
+        'question_text': question_title,
+        'question_type': question_type,
+        'buggy_code': '',  # Original buggy code not stored in responses
+        'target_language': technology.lower(),
+        'expected_output': question_entry.get('expected_output', '')  # Include expected output
+    }
+
+    # Test cases not used in current evaluation approach
+    # - Coding questions (Python, JS, etc.): Use embedded test data + output comparison
+    # - DB questions: Use syntax validation + LLM schema evaluation
+    if question_type == 'db_schema':
+        logger.info("🗄️  Database question detected (%s) - will use syntax validation + LLM schema evaluation", technology)
+    else:
+        logger.info("💻 Coding question detected (%s) - will use embedded test data for simple execution", technology)
+        logger.info("🎯 Expected Output: '%s'", question_data.get('expected_output', ''))
+
+    # Call appropriate preparation step (unknown types fall back to explain evaluation)
+    try:
+        prepare = _QUESTION_PREPARERS.get(question_type, _aprepare_explain_question)
+        prepared = await prepare(question_data, response_text, test_cases=None)
+
+        prepared['question_id'] = question_id
+        return prepared
+
+    except Exception as e:
+        logger.error("[ERROR] Failed to evaluate question: %s", e)
+        return {'result': build_error_result(question_title, question_type, e)}
+
+
+def start_progress_file(progress_filepath: str) -> None:
+    """Remove a progress file left over from an earlier, interrupted evaluation"""
+    try:
+        if os.path.exists(progress_filepath):
+            os.remove(progress_filepath)
+    except Exception as e:
+        logger.warning("[WARNING] Could not reset progress file %s: %s", progress_filepath, e)
+
+
+def append_progress(progress_filepath: str, question_id: int, result: EvaluationResult) -> None:
+    """
+    Append one finished question result to the NDJSON progress file
+
+    The file lets partial results survive a crash and can be polled while an
+    evaluation is still running.
+
+    Args:
+        progress_filepath: Path of the .ndjson progress file
+        question_id: Question ID from the coding test file
+        result: Final result for the question
+    """
+    try:
+        with open(progress_filepath, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'question_id': question_id, **result.model_dump()}, ensure_ascii=False, default=str) + '\n')
+            f.flush()
+    except Exception as e:
+        logger.warning("[WARNING] Failed to record progress for Q%s: %s", question_id, e)
+
 
 def evaluate_coding_interview(
     coding_test_filename: str,
     uploads_folder: str,
     interviews_folder: str
+) -> Dict[str, Any]:
+    """Synchronous wrapper around aevaluate_coding_interview() for Flask routes"""
+    return asyncio.run(aevaluate_coding_interview(coding_test_filename, uploads_folder, interviews_folder))
+
+
+async def aevaluate_coding_interview(
+    coding_test_filename: str,
+    uploads_folder: str,
+    interviews_folder: str
 ) -> Dict[str, Any]:
     """
     Main orchestrator for evaluating a complete coding interview
 
     Process:
     1. Load code-test-{name}-{date}.json
-    2. For each question:
-       - Load test cases
+    2. Prepare questions concurrently (at most EVAL_CONCURRENCY at a time):
        - Determine question type
-       - Call appropriate evaluator
-       - time.sleep(0.3) between compilations
-    3. Calculate overall score
-    4. Save to code-evaluation-{name}-{date}.json
+       - Compile/validate via Piston (rate limited to PISTON_RPS requests/second)
+    3. Judge all prepared questions with one batched LLM call
+    4. Append each finished result to code-evaluation-{name}-{date}.json.ndjson
+    5. Calculate overall score
+    6. Save to code-evaluation-{name}-{date}.json (the .ndjson progress file is then removed)
 
     Args:
         coding_test_filename: Name of coding test file (e.g., "code-test-malek-ajmi-10-10-2025.json")
@@ -578,12 +1219,12 @@ def evaluate_coding_interview(
     Returns:
         Dict with evaluation results
     """
-    print("=" * 60)
-    print("STARTING CODING INTERVIEW EVALUATION")
-    print("=" * 60)
+    logger.info("\n".join([_BANNER, "STARTING CODING INTERVIEW EVALUATION", _BANNER]))
 
     # Load coding test responses
     test_filepath = os.path.join(interviews_folder, coding_test_filename)
+    # Answers saved since the file was last written are still in the response log
+    fold_coding_response_log(test_filepath)
     if not os.path.exists(test_filepath):
         return {
             'success': False,
@@ -604,87 +1245,55 @@ def evaluate_coding_interview(
     interview_date = coding_responses.get('interview_date', datetime.now().strftime('%d-%m-%Y'))
     questions_list = coding_responses.get('questions', [])
 
-    print(f"\nCandidate: {candidate_name}")
-    print(f"Interview Date: {interview_date}")
-    print(f"Total Questions: {len(questions_list)}")
-    print()
-
-    # Evaluate each question
-    evaluation_results = []
-    total_score = 0
+    logger.info("\nCandidate: %s\nInterview Date: %s\nTotal Questions: %d\n", candidate_name, interview_date, len(questions_list))
 
-    for question_entry in questions_list:
-        # Extract question data from structured format
-        question_id = question_entry.get('question_id', 0)
-        question_title = question_entry.get('question_title', 'Unknown Question')
-        question_type = question_entry.get('question_type', 'coding_debug')
-        technology = question_entry.get('technology', 'python')
-        candidate_code = question_entry.get('candidate_code', '')
-        candidate_explanation = question_entry.get('candidate_explanation', '')
-        response_text = question_entry.get('candidate_full_response', '')
-
-        print(f"\n{'='*60}")
-        print(f"Evaluating Q{question_id}: {question_title}")
-        print(f"{'='*60}")
-        print(f"Type: {question_type} | Technology: {technology}")
-
-        # Build question data using structured info
-        question_data = {
-            'question_text': question_title,
-            'question_type': question_type,
-            'buggy_code': '',  # Original buggy code not stored in responses
-            'target_language': technology.lower(),
-            'expected_output': question_entry.get('expected_output', '')  # Include expected output
-        }
-
-        # Test cases not used in current evaluation approach
-        # - Coding questions (Python, JS, etc.): Use embedded test data + output comparison
-        # - DB questions: Use syntax validation + LLM schema evaluation
-        test_cases = None
+    evaluation_filename = coding_test_filename.replace('code-test-', 'code-evaluation-')
+    evaluation_filepath = os.path.join(interviews_folder, evaluation_filename)
+    progress_filepath = evaluation_filepath + '.ndjson'
+    start_progress_file(progress_filepath)
+
+    # Compile/validate questions, at most EVAL_CONCURRENCY at a time, handling each as it finishes
+    question_slots = asyncio.Semaphore(max(1, EVAL_CONCURRENCY))
+
+    async def _prepare(index: int, question_entry: Dict[str, Any]):
+        async with question_slots:
+            return index, await _aprepare_question(question_entry)
+
+    prepared_questions = [None] * len(questions_list)
+    for finished in asyncio.as_completed([_prepare(i, entry) for i, entry in enumerate(questions_list)]):
+        index, prepared = await finished
+        prepared_questions[index] = prepared
+
+        # Questions that failed during preparation are already final
+        if 'result' in prepared:
+            append_progress(progress_filepath, questions_list[index].get('question_id', 0), prepared['result'])
+
+    # Judge every successfully prepared question in a single LLM call
+    pending = [prepared for prepared in prepared_questions if 'result' not in prepared]
+    verdicts = await abatch_evaluate_with_llm(
+        [prepared['judge_inputs'] for prepared in pending],
+        cache_dir=os.path.join(interviews_folder, JUDGE_CACHE_DIRNAME)
+    )
 
-        if question_type == 'db_schema':
-            print(f"🗄️  Database question detected ({technology}) - will use syntax validation + LLM schema evaluation")
-        else:
-            print(f"💻 Coding question detected ({technology}) - will use embedded test data for simple execution")
-            print(f"🎯 Expected Output: '{question_data.get('expected_output', '')}'")
+    for prepared, (score, feedback) in zip(pending, verdicts):
+        try:
+            prepared['result'] = build_evaluation_result(prepared, score, feedback)
+        except Exception as e:
+            logger.error("[ERROR] Failed to evaluate question: %s", e)
+            question_data = prepared['judge_inputs']['question_data']
+            prepared['result'] = build_error_result(question_data['question_text'], question_data['question_type'], e)
+        append_progress(progress_filepath, prepared['question_id'], prepared['result'])
 
-        # Rate limiting delay
-        if len(evaluation_results) > 0:
-            time.sleep(0.3)
+    evaluation_results = [prepared['result'] for prepared in prepared_questions]
+    total_score = 0
 
-        # Call appropriate evaluator
-        try:
-            if question_type == 'coding_debug':
-                result = evaluate_debug_question(question_data, response_text, test_cases=None)
-            elif question_type == 'coding_explain':
-                result = evaluate_explain_question(question_data, response_text, test_cases=None)
-            elif question_type == 'db_schema':
-                result = evaluate_db_schema_question(question_data, response_text, test_cases=None)
-            else:
-                # Fallback to explain evaluation
-                result = evaluate_explain_question(question_data, response_text, test_cases=None)
-
-            evaluation_results.append(result)
-            total_score += result.score
-
-            print(f"Score: {result.score}/10")
-            print(f"Feedback:")
-            for i, phrase in enumerate(result.feedback, 1):
-                print(f"  {i}. {phrase}")
+    for question_entry, result in zip(questions_list, evaluation_results):
+        total_score += result.score
 
-        except Exception as e:
-            print(f"[ERROR] Failed to evaluate question: {e}")
-            # Add error result
-            evaluation_results.append(EvaluationResult(
-                question_title=question_title,
-                question_type=question_type,
-                score=0,
-                feedback=[
-                    "Evaluation failed due to error",
-                    f"Error: {str(e)}",
-                    "Manual review required"
-                ],
-                details={'error': str(e)}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(
+                [f"\nQ{question_entry.get('question_id', 0)} Score: {result.score}/10", "Feedback:"]
+                + [f"  {i}. {phrase}" for i, phrase in enumerate(result.feedback, 1)]
             ))
 
     # Calculate overall score
@@ -711,24 +1320,22 @@ def evaluate_coding_interview(
     )
 
     # Save evaluation results
-    evaluation_filename = coding_test_filename.replace('code-test-', 'code-evaluation-')
-    evaluation_filepath = os.path.join(interviews_folder, evaluation_filename)
-
     try:
+        # Serialize straight from the model (no intermediate dict)
         with open(evaluation_filepath, 'w', encoding='utf-8') as f:
-            json.dump(evaluation.model_dump(), f, indent=2)
-        print(f"\n[OK] Evaluation saved to: {evaluation_filepath}")
+            f.write(evaluation.model_dump_json(indent=2))
+        logger.info("\n[OK] Evaluation saved to: %s", evaluation_filepath)
+        # Final file supersedes the per-question progress file
+        if os.path.exists(progress_filepath):
+            os.remove(progress_filepath)
     except Exception as e:
-        print(f"\n[ERROR] Failed to save evaluation: {e}")
+        logger.error("\n[ERROR] Failed to save evaluation: %s", e)
 
-    print("\n" + "=" * 60)
-    print(f"EVALUATION COMPLETE")
-    print(f"Overall Score: {overall_score:.1f}/10")
-    print("=" * 60)
+    logger.info("\n%s\nEVALUATION COMPLETE\nOverall Score: %.1f/10\n%s", _BANNER, overall_score, _BANNER)
 
     return {
         'success': True,
-        'evaluation_results': evaluation.model_dump()  # FIXED: Changed from 'evaluation' to match frontend expectation
+        'evaluation_results': evaluation.model_dump(mode='json')  # FIXED: Changed from 'evaluation' to match frontend expectation
     }
 
 
@@ -742,17 +1349,14 @@ def detect_question_type(question_title: str) -> str:
     Returns:
         Question type: 'coding_debug', 'coding_explain', or 'db_schema'
     """
-    title_lower = question_title.lower()
-
-    if 'debug' in title_lower or 'fix' in title_lower or 'bug' in title_lower:
-        return 'coding_debug'
-    elif 'analysis' in title_lower or 'analyze' in title_lower or 'explain' in title_lower:
-        return 'coding_explain'
-    elif 'database' in title_lower or 'schema' in title_lower or 'sql' in title_lower:
-        return 'db_schema'
-    else:
-        # Default to debug
-        return 'coding_debug'
+    # Single scan for every keyword; debug keywords win over explain, explain over database
+    found_types = {_TYPE_BY_KEYWORD[keyword.lower()] for keyword in _TYPE_KEYWORD_RE.findall(question_title)}
+    for question_type in ('coding_debug', 'coding_explain', 'db_schema'):
+        if question_type in found_types:
+            return question_type
+
+    # Default to debug
+    return 'coding_debug'
 
 
 # Example usage
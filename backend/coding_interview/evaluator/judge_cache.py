@@ -0,0 +1,73 @@
+"""
+Judge Verdict Cache
+Content-addressed on-disk cache of LLM judge verdicts so that re-evaluating
+an identical submission does not call the LLM again
+"""
+
+import hashlib
+import json
+from typing import List, Optional, Tuple
+
+from ..file_cache import FileCache
+
+# Cache directory name, created inside the interviews folder
+JUDGE_CACHE_DIRNAME = '.judge_cache'
+
+
+def _load_verdict(text: str) -> Tuple[int, List[str]]:
+    """Parse a stored {'score', 'feedback'} entry"""
+    data = json.loads(text)
+    return int(data['score']), list(data['feedback'])
+
+
+# JUDGE_CACHE_DISABLE=1 turns the cache off (e.g. while validating prompt changes)
+_judge_cache = FileCache(
+    'judge cache',
+    'JUDGE_CACHE_DISABLE',
+    serialize=lambda verdict: json.dumps({'score': verdict[0], 'feedback': verdict[1]}, ensure_ascii=False),
+    deserialize=_load_verdict
+)
+
+
+def make_judge_cache_key(*parts: str) -> str:
+    """
+    Build a cache key from everything the judge sees
+
+    Args:
+        parts: Prompt fragments (rubric, submission summary, ...)
+
+    Returns:
+        Hex sha256 digest of the fragments
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def load_cached_verdict(cache_dir: Optional[str], key: str) -> Optional[Tuple[int, List[str]]]:
+    """
+    Look up a stored verdict
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        key: Key from make_judge_cache_key()
+
+    Returns:
+        Tuple of (score, feedback), or None on a miss
+    """
+    return _judge_cache.load(cache_dir, key)
+
+
+def store_cached_verdict(cache_dir: Optional[str], key: str, score: int, feedback: List[str]) -> None:
+    """
+    Store a verdict
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        key: Key from make_judge_cache_key()
+        score: Final score
+        feedback: Final feedback phrases
+    """
+    _judge_cache.store(cache_dir, key, (score, feedback))
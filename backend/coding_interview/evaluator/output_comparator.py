@@ -3,6 +3,7 @@ Output Comparison Utility for Code Evaluation
 Provides intelligent comparison between expected and actual code outputs
 """
 
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import Optional
 import re
@@ -20,9 +21,24 @@ class ExecutionComparison(BaseModel):
     comparison_notes: str = Field(default="", description="Additional comparison details")
 
 
+# Characters that can appear in a plain decimal/scientific number
+_NUMERIC_CHARS = frozenset('0123456789.eE+-')
+
+
+def _is_numeric_like(text: str) -> bool:
+    """Cheap pre-check so non-numeric outputs skip the float() try/except"""
+    return bool(text) and all(c in _NUMERIC_CHARS for c in text)
+
+
+# Only outputs shorter than this are memoized, so the caches never pin large
+# program outputs in the long-running server process
+_MEMOIZE_MAX_LEN = 4096
+
+
 def normalize_output(output: str) -> str:
     """
-    Normalize output for comparison
+    Normalize output for comparison (short outputs are memoized: the same
+    expected output is compared against many runs)
 
     Args:
         output: Raw output string
@@ -30,13 +46,27 @@ def normalize_output(output: str) -> str:
     Returns:
         Normalized output string
     """
-    # Strip whitespace
-    normalized = output.strip()
-    # Normalize line endings
-    normalized = normalized.replace('\r\n', '\n')
-    # Remove trailing whitespace from each line
-    normalized = '\n'.join(line.rstrip() for line in normalized.split('\n'))
-    return normalized
+    if len(output) < _MEMOIZE_MAX_LEN:
+        return _normalize_output_cached(output)
+    return _normalize_output(output)
+
+
+def _normalize_output(output: str) -> str:
+    """Implementation of normalize_output()"""
+    # splitlines() handles \r\n / \r / \n in one pass; drop trailing whitespace
+    # from each line, then surrounding blank lines/whitespace
+    return '\n'.join(line.rstrip() for line in output.splitlines()).strip()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_output_cached(output: str) -> str:
+    """Memoized normalize_output() for short outputs"""
+    return _normalize_output(output)
+
+
+def _tokenize(text: str) -> frozenset:
+    """Lower-cased word set of a normalized output"""
+    return frozenset(text.lower().split())
 
 
 def compare_outputs(
@@ -65,13 +95,14 @@ def compare_outputs(
     """
     # IMPORTANT: Include stderr in actual output for comparison
     # Runtime errors should be considered as incorrect output
+    stderr_stripped = stderr.strip()
     actual_with_errors = actual
-    if stderr.strip():
+    if stderr_stripped:
         # Append stderr to actual output so errors are visible in comparison
-        actual_with_errors = (actual + "\n" + stderr).strip() if actual.strip() else stderr.strip()
+        actual_with_errors = (actual + "\n" + stderr).strip() if actual.strip() else stderr_stripped
 
     # Check for execution errors first
-    if exit_code != 0 or stderr.strip():
+    if exit_code != 0 or stderr_stripped:
         return ExecutionComparison(
             expected_output=expected,
             actual_output=actual_with_errors,  # Include errors in output
@@ -83,12 +114,14 @@ def compare_outputs(
             comparison_notes=f"Code failed with exit code {exit_code}: {stderr[:100]}"
         )
 
-    # Normalize both outputs
-    expected_norm = normalize_output(expected)
-    actual_norm = normalize_output(actual)
+    # Exact match check (raw equality first, so identical outputs skip normalization)
+    exact_match = expected == actual
+    if not exact_match:
+        expected_norm = normalize_output(expected)
+        actual_norm = normalize_output(actual)
+        exact_match = expected_norm == actual_norm
 
-    # Exact match check
-    if expected_norm == actual_norm:
+    if exact_match:
         return ExecutionComparison(
             expected_output=expected,
             actual_output=actual,
@@ -101,25 +134,26 @@ def compare_outputs(
         )
 
     # Try numeric comparison (handle floating point tolerance)
-    try:
-        expected_float = float(expected_norm)
-        actual_float = float(actual_norm)
-        diff = abs(expected_float - actual_float)
-
-        if diff < 0.001:
-            return ExecutionComparison(
-                expected_output=expected,
-                actual_output=actual,
-                exit_code=exit_code,
-                stderr=stderr,
-                compilation_success=True,
-                match_status="EXACT_MATCH",
-                match_confidence=1.0,
-                comparison_notes=f"Numeric match within tolerance (diff: {diff:.6f})"
-            )
-    except ValueError:
-        # Not numeric, continue with other checks
-        pass
+    if _is_numeric_like(expected_norm) and _is_numeric_like(actual_norm):
+        try:
+            expected_float = float(expected_norm)
+            actual_float = float(actual_norm)
+            diff = abs(expected_float - actual_float)
+
+            if diff < 0.001:
+                return ExecutionComparison(
+                    expected_output=expected,
+                    actual_output=actual,
+                    exit_code=exit_code,
+                    stderr=stderr,
+                    compilation_success=True,
+                    match_status="EXACT_MATCH",
+                    match_confidence=1.0,
+                    comparison_notes=f"Numeric match within tolerance (diff: {diff:.6f})"
+                )
+        except ValueError:
+            # Numeric-looking but not a number (e.g. "1-2"), continue with other checks
+            pass
 
     # Partial match detection - substring matching
     if actual_norm and expected_norm:
@@ -138,13 +172,18 @@ def compare_outputs(
             )
 
         # Check for similar words/tokens (for more complex partial matching)
-        expected_words = set(expected_norm.lower().split())
-        actual_words = set(actual_norm.lower().split())
-
-        if expected_words and actual_words:
-            common_words = expected_words & actual_words
-            if common_words:
-                confidence = len(common_words) / len(expected_words | actual_words)
+        expected_words = _tokenize(expected_norm)
+        actual_words = _tokenize(actual_norm)
+
+        # Jaccard can never exceed min(|A|, |B|) / max(|A|, |B|), so skip the
+        # intersection when the word-set sizes alone rule out > 30% overlap
+        if expected_words and actual_words and (
+            min(len(expected_words), len(actual_words)) > 0.3 * max(len(expected_words), len(actual_words))
+        ):
+            # Jaccard overlap; |A | B| = |A| + |B| - |A & B| avoids building the union set
+            common_count = len(expected_words & actual_words)
+            if common_count:
+                confidence = common_count / (len(expected_words) + len(actual_words) - common_count)
                 if confidence > 0.3:  # At least 30% word overlap
                     return ExecutionComparison(
                         expected_output=expected,
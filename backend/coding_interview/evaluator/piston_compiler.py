@@ -3,20 +3,46 @@ Piston API Client for Code Compilation and Execution
 Provides interface to execute code in multiple languages using Piston API
 """
 
+import asyncio
+import os
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 import json
 
+try:
+    import orjson  # Optional: faster parsing of Piston responses
+except ImportError:
+    orjson = None
+
+from .output_comparator import normalize_output
+
 # Piston API Configuration
 PISTON_BASE_URL = "https://emkc.org/api/v2/piston"
 PISTON_RUNTIMES_URL = f"{PISTON_BASE_URL}/runtimes"
 PISTON_EXECUTE_URL = f"{PISTON_BASE_URL}/execute"
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
 # Rate limiting configuration
-REQUEST_DELAY = 0.3  # 300ms delay between requests (safety margin for 5 req/s limit)
+# Public Piston API allows 5 requests/second; PISTON_RPS=0 (or negative) disables the limit,
+# e.g. for a self-hosted Piston instance
+PISTON_RPS = float(os.getenv('PISTON_RPS', '5'))
+if PISTON_RPS <= 0:
+    print(f"[WARNING] PISTON_RPS={PISTON_RPS:g}: Piston rate limiting disabled")
+    PISTON_RPS = 0.0
+# Minimum spacing between request starts (0 = no limit)
+_REQUEST_INTERVAL = 1.0 / PISTON_RPS if PISTON_RPS > 0 else 0.0
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 10  # 10 seconds timeout per request
+PISTON_MAX_WORKERS = int(os.getenv('PISTON_MAX_WORKERS', '5'))  # Concurrent test case executions
+
+# Shared HTTP session: keep-alive connections are reused across requests
+# (requests.Session is safe to share between the evaluation worker threads)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0))
 
 # Language mapping (user-friendly name -> Piston language identifier)
 LANGUAGE_MAP = {
@@ -54,19 +80,35 @@ FILE_EXTENSIONS = {
 }
 
 
+# Runtime list changes rarely; cached for RUNTIMES_CACHE_TTL seconds
+RUNTIMES_CACHE_TTL = 3600
+_runtimes_cache: List[Dict[str, Any]] = []
+_runtimes_fetched_at = 0.0
+
+
 def get_available_runtimes() -> List[Dict[str, Any]]:
     """
     Fetch available programming language runtimes from Piston API
 
+    The list is cached for RUNTIMES_CACHE_TTL seconds; failed fetches are
+    not cached.
+
     Returns:
         List of runtime dictionaries with language, version, and aliases
     """
+    global _runtimes_cache, _runtimes_fetched_at
+
+    if _runtimes_cache and time.monotonic() - _runtimes_fetched_at < RUNTIMES_CACHE_TTL:
+        return _runtimes_cache
+
     try:
-        response = requests.get(PISTON_RUNTIMES_URL, timeout=REQUEST_TIMEOUT)
+        response = _SESSION.get(PISTON_RUNTIMES_URL, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         runtimes = response.json()
 
         print(f"[OK] Fetched {len(runtimes)} available runtimes from Piston API")
+        _runtimes_cache = runtimes
+        _runtimes_fetched_at = time.monotonic()
         return runtimes
 
     except requests.exceptions.RequestException as e:
@@ -74,6 +116,33 @@ def get_available_runtimes() -> List[Dict[str, Any]]:
         return []
 
 
+# Shared across threads: earliest monotonic time the next request may start
+_rate_limit_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def wait_for_rate_limit() -> None:
+    """
+    Block until the next Piston request fits within PISTON_RPS
+
+    Requests from all threads are spaced 1/PISTON_RPS seconds apart, so
+    concurrent evaluations use the full budget without exceeding it.
+    Returns immediately when rate limiting is disabled (PISTON_RPS <= 0).
+    """
+    global _next_request_at
+
+    if not _REQUEST_INTERVAL:
+        return
+
+    with _rate_limit_lock:
+        now = time.monotonic()
+        slot = max(_next_request_at, now)
+        _next_request_at = slot + _REQUEST_INTERVAL
+
+    if slot > now:
+        time.sleep(slot - now)
+
+
 def normalize_language(language: str) -> Optional[str]:
     """
     Normalize language name to Piston API format
@@ -84,8 +153,12 @@ def normalize_language(language: str) -> Optional[str]:
     Returns:
         Normalized language name or None if not found
     """
-    language_lower = language.lower().strip()
-    return LANGUAGE_MAP.get(language_lower)
+    # Fast path: callers almost always pass an already-lowercase name
+    normalized = LANGUAGE_MAP.get(language)
+    if normalized is not None:
+        return normalized
+
+    return LANGUAGE_MAP.get(language.lower().strip())
 
 
 def execute_code(
@@ -151,22 +224,26 @@ def execute_code(
         "run_timeout": run_timeout
     }
 
+    # Serialize once; retries resend the same body
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+
     # Retry logic with exponential backoff
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            # Rate limiting delay
-            time.sleep(REQUEST_DELAY)
+            # Rate limiting (shared across threads)
+            wait_for_rate_limit()
 
             # Execute request
-            response = requests.post(
+            response = _SESSION.post(
                 PISTON_EXECUTE_URL,
-                json=payload,
+                data=body,
+                headers=JSON_HEADERS,
                 timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
 
-            # Parse response
-            result = response.json()
+            # Parse response (orjson when installed; both raise json.JSONDecodeError subclasses)
+            result = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
             run_data = result.get('run', {})
 
             # Build standardized response
@@ -238,21 +315,122 @@ def execute_code(
     }
 
 
+async def aexecute_code(
+    code: str,
+    language: str,
+    stdin: str = "",
+    compile_timeout: int = 10000,
+    run_timeout: int = 5000
+) -> Dict[str, Any]:
+    """
+    Async variant of execute_code() (runs off the event loop thread)
+
+    Args:
+        Same as execute_code()
+
+    Returns:
+        Same structure as execute_code()
+    """
+    return await asyncio.to_thread(
+        execute_code, code, language,
+        stdin=stdin, compile_timeout=compile_timeout, run_timeout=run_timeout
+    )
+
+
+# (description, stdin, normalized expected output)
+PreparedTestCase = Tuple[str, str, str]
+
+
+def _prenormalize_test_cases(test_cases: List[Dict[str, str]]) -> List[PreparedTestCase]:
+    """
+    Extract and normalize test case fields once, so a batch run against both
+    buggy and fixed code does not redo it per run
+
+    Args:
+        test_cases: List of test case dicts with 'input', 'expected_output', 'description'
+
+    Returns:
+        List of (description, input, normalized expected output) tuples
+    """
+    return [
+        (
+            test_case.get('description', 'Test case'),
+            test_case.get('input', ''),
+            normalize_output(test_case.get('expected_output', ''))
+        )
+        for test_case in test_cases
+    ]
+
+
+def _run_test_case(code: str, language: str, test_case: PreparedTestCase) -> Dict[str, Any]:
+    """
+    Run code against a single prepared test case
+
+    Args:
+        code: Source code to test
+        language: Programming language
+        test_case: (description, input, normalized expected output) tuple
+
+    Returns:
+        Test result dict (see run_test_cases())
+    """
+    description, test_input, expected_output = test_case
+
+    # Execute code with test input
+    execution_result = execute_code(code, language, stdin=test_input)
+
+    if not execution_result['success']:
+        return {
+            'description': description,
+            'input': test_input,
+            'expected_output': expected_output,
+            'actual_output': '',
+            'passed': False,
+            'error': execution_result.get('error', 'Execution failed'),
+            'stderr': execution_result.get('stderr', '')
+        }
+
+    # Get actual output (normalized the same way as the expected output)
+    actual_output = normalize_output(execution_result['stdout'])
+
+    # Compare outputs (simple string comparison)
+    passed = actual_output == expected_output
+
+    result = {
+        'description': description,
+        'input': test_input,
+        'expected_output': expected_output,
+        'actual_output': actual_output,
+        'passed': passed,
+        'exit_code': execution_result['exit_code']
+    }
+
+    # Add stderr if present
+    if execution_result['stderr']:
+        result['stderr'] = execution_result['stderr']
+
+    return result
+
+
 def run_test_cases(
     code: str,
     language: str,
-    test_cases: List[Dict[str, str]]
+    test_cases: Union[List[Dict[str, str]], List[PreparedTestCase]]
 ) -> List[Dict[str, Any]]:
     """
     Run code against multiple test cases
 
+    Test cases run concurrently on up to PISTON_MAX_WORKERS threads; the
+    shared rate gate in execute_code() keeps them within PISTON_RPS.
+
     Args:
         code: Source code to test
         language: Programming language
-        test_cases: List of test case dicts with 'input', 'expected_output', 'description'
+        test_cases: List of test case dicts with 'input', 'expected_output', 'description',
+            or the output of _prenormalize_test_cases()
 
     Returns:
-        List of test result dicts:
+        List of test result dicts, in test case order:
         [
             {
                 'description': str,
@@ -264,48 +442,45 @@ def run_test_cases(
             }
         ]
     """
-    results = []
-
-    for test_case in test_cases:
-        test_input = test_case.get('input', '')
-        expected_output = test_case.get('expected_output', '').strip()
-        description = test_case.get('description', 'Test case')
-
-        # Execute code with test input
-        execution_result = execute_code(code, language, stdin=test_input)
-
-        if not execution_result['success']:
-            results.append({
-                'description': description,
-                'input': test_input,
-                'expected_output': expected_output,
-                'actual_output': '',
-                'passed': False,
-                'error': execution_result.get('error', 'Execution failed'),
-                'stderr': execution_result.get('stderr', '')
-            })
-            continue
-
-        # Get actual output
-        actual_output = execution_result['stdout'].strip()
-
-        # Compare outputs (simple string comparison)
-        passed = actual_output == expected_output
-
-        results.append({
-            'description': description,
-            'input': test_input,
-            'expected_output': expected_output,
-            'actual_output': actual_output,
-            'passed': passed,
-            'exit_code': execution_result['exit_code']
-        })
+    if test_cases and isinstance(test_cases[0], dict):
+        test_cases = _prenormalize_test_cases(test_cases)
+
+    if len(test_cases) <= 1 or PISTON_MAX_WORKERS <= 1:
+        return [_run_test_case(code, language, test_case) for test_case in test_cases]
+
+    with ThreadPoolExecutor(max_workers=min(PISTON_MAX_WORKERS, len(test_cases))) as pool:
+        return list(pool.map(lambda test_case: _run_test_case(code, language, test_case), test_cases))
+
+
+async def arun_test_cases(
+    code: str,
+    language: str,
+    test_cases: Union[List[Dict[str, str]], List[PreparedTestCase]]
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of run_test_cases()
+
+    At most PISTON_MAX_WORKERS test cases run at once, like run_test_cases().
+    The rate gate in execute_code() only spaces out request starts (and is
+    off when PISTON_RPS <= 0), so it does not bound the number of threads
+    taken from the event loop's default executor.
+
+    Args:
+        Same as run_test_cases()
+
+    Returns:
+        Same structure as run_test_cases()
+    """
+    if test_cases and isinstance(test_cases[0], dict):
+        test_cases = _prenormalize_test_cases(test_cases)
+
+    semaphore = asyncio.Semaphore(max(1, PISTON_MAX_WORKERS))
 
-        # Add stderr if present
-        if execution_result['stderr']:
-            results[-1]['stderr'] = execution_result['stderr']
+    async def run_one(test_case):
+        async with semaphore:
+            return await asyncio.to_thread(_run_test_case, code, language, test_case)
 
-    return results
+    return list(await asyncio.gather(*(run_one(test_case) for test_case in test_cases)))
 
 
 def compare_buggy_vs_fixed(
@@ -341,20 +516,99 @@ def compare_buggy_vs_fixed(
             'improvement': float (percentage of tests fixed)
         }
     """
-    # Run buggy code through test cases
-    print(f"[BUGGY] Running buggy code through {len(test_cases)} test cases...")
-    buggy_test_results = run_test_cases(buggy_code, language, test_cases)
+    print(f"[BUGGY/FIXED] Running both versions through {len(test_cases)} test cases...")
+    buggy_test_results, fixed_test_results = _run_buggy_and_fixed(
+        buggy_code, fixed_code, language, _prenormalize_test_cases(test_cases)
+    )
+
+    return summarize_buggy_vs_fixed(buggy_test_results, fixed_test_results, len(test_cases))
+
+
+def _run_buggy_and_fixed(
+    buggy_code: str,
+    fixed_code: str,
+    language: str,
+    prepared_cases: List[PreparedTestCase]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Run both versions through the test cases on one shared thread pool
+
+    Jobs are interleaved (buggy 0, fixed 0, buggy 1, ...) so both versions
+    draw from the same PISTON_RPS budget instead of running back to back.
+
+    Args:
+        buggy_code: Original buggy code
+        fixed_code: Candidate's fixed code
+        language: Programming language
+        prepared_cases: Output of _prenormalize_test_cases()
+
+    Returns:
+        Tuple of (buggy test results, fixed test results), in test case order
+    """
+    jobs = [
+        (code, test_case)
+        for test_case in prepared_cases
+        for code in (buggy_code, fixed_code)
+    ]
+    if not jobs:
+        return [], []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(PISTON_MAX_WORKERS, len(jobs)))) as pool:
+        results = list(pool.map(lambda job: _run_test_case(job[0], language, job[1]), jobs))
+
+    # Scatter back: even positions are buggy runs, odd positions fixed runs
+    return results[0::2], results[1::2]
+
+
+async def acompare_buggy_vs_fixed(
+    buggy_code: str,
+    fixed_code: str,
+    language: str,
+    test_cases: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """
+    Async variant of compare_buggy_vs_fixed() (runs off the event loop thread)
+
+    Args:
+        buggy_code: Original buggy code
+        fixed_code: Candidate's fixed code
+        language: Programming language
+        test_cases: List of test cases
+
+    Returns:
+        Same structure as compare_buggy_vs_fixed()
+    """
+    print(f"[BUGGY/FIXED] Running both versions through {len(test_cases)} test cases...")
+    buggy_test_results, fixed_test_results = await asyncio.to_thread(
+        _run_buggy_and_fixed, buggy_code, fixed_code, language, _prenormalize_test_cases(test_cases)
+    )
+
+    return summarize_buggy_vs_fixed(buggy_test_results, fixed_test_results, len(test_cases))
+
+
+def summarize_buggy_vs_fixed(
+    buggy_test_results: List[Dict[str, Any]],
+    fixed_test_results: List[Dict[str, Any]],
+    total_tests: int
+) -> Dict[str, Any]:
+    """
+    Build the compare_buggy_vs_fixed() result from both test runs
+
+    Args:
+        buggy_test_results: run_test_cases() output for the buggy code
+        fixed_test_results: run_test_cases() output for the fixed code
+        total_tests: Number of test cases
+
+    Returns:
+        Comparison dict (see compare_buggy_vs_fixed())
+    """
     buggy_passed = sum(1 for r in buggy_test_results if r.get('passed', False))
     buggy_compilation_error = any(r.get('error') for r in buggy_test_results)
 
-    # Run fixed code through test cases
-    print(f"[FIXED] Running fixed code through {len(test_cases)} test cases...")
-    fixed_test_results = run_test_cases(fixed_code, language, test_cases)
     fixed_passed = sum(1 for r in fixed_test_results if r.get('passed', False))
     fixed_compilation_error = any(r.get('error') for r in fixed_test_results)
 
     # Calculate improvement
-    total_tests = len(test_cases)
     improvement = 0.0
     if total_tests > 0:
         improvement = ((fixed_passed - buggy_passed) / total_tests) * 100
@@ -0,0 +1,108 @@
+"""
+File Cache
+Shared content-addressed on-disk cache behind the skill analysis, generated
+question and judge verdict caches: one file per key, atomic writes, an
+optional maximum age and a <NAME>_CACHE_DISABLE environment switch
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def env_flag_set(name: str) -> bool:
+    """Return True when the environment variable is set to 1/true/yes"""
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+class FileCache(Generic[T]):
+    """
+    Key/value cache stored as "<cache_dir>/<key>.json" files
+
+    The cache directory is passed on each call (callers derive it from the
+    interviews/uploads folder); None disables caching for that call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        disable_env: str,
+        serialize: Callable[[T], str],
+        deserialize: Callable[[str], T],
+        max_age_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            name: Cache name used in log messages (e.g. "judge cache")
+            disable_env: Environment variable that turns the cache off when set to 1/true/yes
+            serialize: Converts a value to the file's text
+            deserialize: Converts the file's text back to a value (may raise on bad data)
+            max_age_seconds: Entries older than this (by file mtime) are misses; None keeps them forever
+        """
+        self.name = name
+        self.disable_env = disable_env
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.max_age_seconds = max_age_seconds
+
+    def enabled(self) -> bool:
+        """Return False when the cache's disable variable is set"""
+        return not env_flag_set(self.disable_env)
+
+    def load(self, cache_dir: Optional[str], key: str) -> Optional[T]:
+        """
+        Look up a stored value
+
+        Args:
+            cache_dir: Cache directory (None disables caching)
+            key: Cache key (hex digest)
+
+        Returns:
+            Stored value, or None on a miss, an expired entry or an unreadable file
+        """
+        if not cache_dir or not self.enabled():
+            return None
+
+        path = os.path.join(cache_dir, f"{key}.json")
+        try:
+            if self.max_age_seconds is not None and time.time() - os.path.getmtime(path) > self.max_age_seconds:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return self.deserialize(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("[WARNING] Ignoring unreadable %s entry %s: %s", self.name, key, e)
+            return None
+
+    def store(self, cache_dir: Optional[str], key: str, value: T) -> None:
+        """
+        Store a value
+
+        The entry is written to a temp file named after the process and thread,
+        then moved into place, so concurrent readers and writers never see a
+        partial entry.
+
+        Args:
+            cache_dir: Cache directory (None disables caching)
+            key: Cache key (hex digest)
+            value: Value to store
+        """
+        if not cache_dir or not self.enabled():
+            return
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, f"{key}.json")
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.serialize(value))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("[WARNING] Failed to store %s entry %s: %s", self.name, key, e)
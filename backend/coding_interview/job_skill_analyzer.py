@@ -4,228 +4,363 @@ Uses LLM to create structured analysis of skill importance for coding interviews
 """
 
 from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
-import json
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+import asyncio
+import hashlib
+import logging
 import os
 
+from shared.llm_setup import get_llm
+from .file_cache import FileCache
+
+logger = logging.getLogger(__name__)
+
 
 class SkillImportance(BaseModel):
     """Represents a single skill with its importance ranking"""
+    # Immutable so one instance can be shared by all_ranked_skills and the rank partitions
+    model_config = ConfigDict(frozen=True)
+
     skill_name: str = Field(description="Name of the skill or technology")
     importance_rank: int = Field(description="Importance rank: 1 (critical) to 5 (nice to have)")
     required_proficiency_level: str = Field(description="Required proficiency: expert, advanced, intermediate, basic, familiarity")
     category: str = Field(description="Skill category: programming_language, framework, database, devops, tool, soft_skill")
     mentions_count: int = Field(default=1, description="How many times mentioned in job description")
-    context_clues: List[str] = Field(default=[], description="Context phrases that indicate importance")
+    context_clues: List[str] = Field(default_factory=list, description="Context phrases that indicate importance")
 
 
 class DatabaseRequirement(BaseModel):
     """Specific database skill requirements"""
     has_db_requirement: bool = Field(description="Whether job requires database skills")
-    db_technologies: List[str] = Field(default=[], description="Specific database technologies mentioned")
+    db_technologies: List[str] = Field(default_factory=list, description="Specific database technologies mentioned")
     complexity_level: str = Field(default="basic", description="Required complexity: basic, intermediate, advanced, expert")
-    specific_skills: List[str] = Field(default=[], description="Specific database skills: schema design, query optimization, NoSQL, etc.")
+    specific_skills: List[str] = Field(default_factory=list, description="Specific database skills: schema design, query optimization, NoSQL, etc.")
 
 
 class JobSkillAnalysis(BaseModel):
-    """Complete structured analysis of job description skills"""
-    primary_skills: List[SkillImportance] = Field(description="Top priority skills (rank 1-2)")
-    secondary_skills: List[SkillImportance] = Field(description="Important but not critical skills (rank 3)")
-    tertiary_skills: List[SkillImportance] = Field(description="Nice to have skills (rank 4-5)")
+    """
+    Complete structured analysis of job description skills
+
+    Skills are stored once in all_ranked_skills; primary/secondary/tertiary
+    are derived from it by importance rank (and still serialized).
+    """
     database_requirement: DatabaseRequirement = Field(description="Database-specific requirements")
     all_ranked_skills: List[SkillImportance] = Field(description="All skills sorted by importance")
     job_level: str = Field(description="Job level: junior, mid-level, senior, principal")
     overall_difficulty: int = Field(description="Overall technical difficulty 1-10")
 
+    @model_validator(mode='after')
+    def _sort_by_importance(self) -> 'JobSkillAnalysis':
+        # The LLM emits the flat list only; a stable sort keeps its order within a rank
+        self.all_ranked_skills.sort(key=lambda skill: skill.importance_rank)
+        return self
+
+    @computed_field(description="Top priority skills (rank 1-2)")
+    @property
+    def primary_skills(self) -> List[SkillImportance]:
+        return [skill for skill in self.all_ranked_skills if skill.importance_rank <= 2]
+
+    @computed_field(description="Important but not critical skills (rank 3)")
+    @property
+    def secondary_skills(self) -> List[SkillImportance]:
+        return [skill for skill in self.all_ranked_skills if skill.importance_rank == 3]
+
+    @computed_field(description="Nice to have skills (rank 4-5)")
+    @property
+    def tertiary_skills(self) -> List[SkillImportance]:
+        return [skill for skill in self.all_ranked_skills if skill.importance_rank >= 4]
+
+
+# Static skill extraction instructions. Contains no job data, so every call
+# sends a byte-identical prefix (provider prompt caching applies); the job
+# description is appended by build_skill_extraction_prompt().
+SKILL_EXTRACTION_RUBRIC = """
+You are an expert technical recruiter. Extract ALL technical skills from the job description at the end of this prompt and rank them by importance.
+
+IMPORTANCE RANK:
+1 = critical ("required", "must have", "expert in", repeated, or central to the role)
+2 = very important (prominent in key responsibilities or qualifications)
+3 = important (listed in requirements, not emphasized)
+4 = preferred ("nice to have", "plus", "preferred")
+5 = optional (mentioned briefly or in passing)
+
+PROFICIENCY LEVEL:
+expert ("expert in", "deep knowledge", "mastery of"); advanced ("strong skills", "proficient", "extensive experience");
+intermediate ("experience with", "working knowledge", "solid understanding"); basic ("familiarity with", "exposure to", "basic knowledge");
+familiarity ("plus if", "nice to have", "bonus")
+
+DATABASES: look for SQL, PostgreSQL, MySQL, MongoDB, Oracle, Cassandra, Redis, DynamoDB, ElasticSearch, NoSQL, etc.
+and assess the required complexity (schema design, query optimization, indexing, transactions, ...).
+
+JOB LEVEL: junior (0-2 years, entry-level), mid-level (3-5 years), senior (5-10 years, lead responsibilities),
+principal (10+ years, principal/staff/architect, strategic role).
+
+Fill in every field of the JobSkillAnalysis structure: all_ranked_skills (every skill exactly once, most important
+first), database_requirement, job_level and overall_difficulty (1-10). Use lower-case values for proficiency levels, categories and job_level.
+"""
+
+
+# Constant halves of the extraction prompt around the job description
+_PROMPT_PREFIX = SKILL_EXTRACTION_RUBRIC + "\nJOB DESCRIPTION:\n"
+_PROMPT_SUFFIX = "\n"
+
+
+def build_skill_extraction_prompt(job_description: str) -> str:
+    """Static rubric followed by the job description"""
+    return _PROMPT_PREFIX + job_description + _PROMPT_SUFFIX
+
+
+# Cache directory name for skill analyses, created inside the uploads folder
+SKILL_CACHE_DIRNAME = '.skill_cache'
+
+# SKILL_CACHE_DISABLE=1 turns the cache off (e.g. while tuning the extraction rubric)
+_skill_cache = FileCache(
+    'skill cache',
+    'SKILL_CACHE_DISABLE',
+    serialize=lambda analysis: analysis.model_dump_json(),
+    deserialize=JobSkillAnalysis.model_validate_json
+)
+
+
+# Maximum concurrent LLM requests in analyze_job_descriptions_batch()
+SKILL_ANALYSIS_CONCURRENCY = int(os.getenv('SKILL_ANALYSIS_CONCURRENCY', '8'))
+
+# Job descriptions with fewer words than this skip the LLM (e.g. "", "TBD")
+MIN_JOB_DESCRIPTION_WORDS = 5
+
+
+def is_degenerate_job_description(job_description: str) -> bool:
+    """True for empty or near-empty job descriptions not worth an LLM call"""
+    return len(job_description.split()) < MIN_JOB_DESCRIPTION_WORDS
+
 
-def analyze_job_description_skills(job_description: str, llm_instance=None) -> JobSkillAnalysis:
+def make_skill_cache_key(job_description: str) -> str:
+    """
+    Build a cache key for a job description
+
+    Whitespace is collapsed so re-pasted descriptions still hit; the prompt
+    is part of the key so prompt edits invalidate old entries.
+
+    Args:
+        job_description: The job description text
+
+    Returns:
+        Hex sha256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(SKILL_EXTRACTION_RUBRIC.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(' '.join(job_description.split()).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_cached_analysis(cache_dir: Optional[str], key: str) -> Optional[JobSkillAnalysis]:
+    """
+    Look up a stored skill analysis
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        key: Key from make_skill_cache_key()
+
+    Returns:
+        Cached JobSkillAnalysis, or None on a miss
+    """
+    return _skill_cache.load(cache_dir, key)
+
+
+def store_cached_analysis(cache_dir: Optional[str], key: str, analysis: JobSkillAnalysis) -> None:
+    """
+    Store a skill analysis
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        key: Key from make_skill_cache_key()
+        analysis: Analysis returned by the LLM
+    """
+    _skill_cache.store(cache_dir, key, analysis)
+
+
+def analyze_job_description_skills(
+    job_description: str,
+    llm_instance=None,
+    cache_dir: Optional[str] = None
+) -> JobSkillAnalysis:
     """
     Analyze job description using LLM to extract and rank skills
 
     Args:
         job_description: The job description text
-        llm_instance: Optional LLM instance (uses global llm if not provided)
+        llm_instance: Optional LLM instance (uses the shared LLM if not provided)
+        cache_dir: Directory for cached analyses (optional; fallback analyses are never cached)
 
     Returns:
         JobSkillAnalysis with structured skill rankings
     """
+    # Too little text for the LLM to rank anything: keyword analysis is as good
+    if is_degenerate_job_description(job_description):
+        logger.info("[INFO] Job description too short for LLM analysis, using keyword analysis")
+        return create_fallback_analysis(job_description)
+
     if llm_instance is None:
-        llm_instance = llm
+        llm_instance = get_llm()
+
+    # Repeat analyses of the same job description are served from the cache
+    cache_key = make_skill_cache_key(job_description)
+    cached = load_cached_analysis(cache_dir, cache_key)
+    if cached is not None:
+        logger.info("[INFO] Using cached job skill analysis")
+        return cached
 
     # Create extraction prompt
-    extraction_prompt = f"""
-You are an expert technical recruiter analyzing job descriptions to identify and rank required skills.
-
-JOB DESCRIPTION:
-{job_description}
-
-Analyze this job description and extract ALL technical skills, ranking them by importance.
-
-IMPORTANCE RANKING CRITERIA:
-- Rank 1 (Critical): Skills explicitly marked as "required", "must have", "expert in", appear multiple times, or are central to the role
-- Rank 2 (Very Important): Skills mentioned prominently in key responsibilities or qualifications
-- Rank 3 (Important): Skills mentioned in requirements but not emphasized
-- Rank 4 (Preferred): Skills marked as "nice to have", "plus", "preferred"
-- Rank 5 (Optional): Skills mentioned briefly or in passing
-
-PROFICIENCY LEVEL INDICATORS:
-- "Expert": "expert in", "deep knowledge", "mastery of"
-- "Advanced": "strong skills", "proficient", "extensive experience"
-- "Intermediate": "experience with", "working knowledge", "solid understanding"
-- "Basic": "familiarity with", "exposure to", "basic knowledge"
-- "Familiarity": "plus if", "nice to have", "bonus"
-
-DATABASE DETECTION:
-Look for: SQL, PostgreSQL, MySQL, MongoDB, Oracle, Cassandra, Redis, DynamoDB, ElasticSearch, NoSQL, etc.
-Assess required complexity: schema design, query optimization, indexing, transactions, etc.
-
-JOB LEVEL DETECTION:
-- Junior: 0-2 years, entry-level, junior in title
-- Mid-level: 3-5 years, intermediate, mid-level in title
-- Senior: 5-10 years, senior in title, lead responsibilities
-- Principal: 10+ years, principal/staff/architect in title, strategic role
-
-Return ONLY valid JSON in this exact format:
-{{
-    "primary_skills": [
-        {{
-            "skill_name": "SQL",
-            "importance_rank": 1,
-            "required_proficiency_level": "expert",
-            "category": "database",
-            "mentions_count": 3,
-            "context_clues": ["must have expert SQL skills", "complex query optimization required"]
-        }}
-    ],
-    "secondary_skills": [
-        {{
-            "skill_name": "Python",
-            "importance_rank": 3,
-            "required_proficiency_level": "intermediate",
-            "category": "programming_language",
-            "mentions_count": 2,
-            "context_clues": ["experience with Python for scripting"]
-        }}
-    ],
-    "tertiary_skills": [
-        {{
-            "skill_name": "Docker",
-            "importance_rank": 4,
-            "required_proficiency_level": "basic",
-            "category": "devops",
-            "mentions_count": 1,
-            "context_clues": ["familiarity with containerization is a plus"]
-        }}
-    ],
-    "database_requirement": {{
-        "has_db_requirement": true,
-        "db_technologies": ["SQL", "PostgreSQL", "MongoDB"],
-        "complexity_level": "expert",
-        "specific_skills": ["schema design", "query optimization", "indexing", "complex joins"]
-    }},
-    "all_ranked_skills": [
-        {{
-            "skill_name": "SQL",
-            "importance_rank": 1,
-            "required_proficiency_level": "expert",
-            "category": "database",
-            "mentions_count": 3,
-            "context_clues": ["must have expert SQL skills"]
-        }},
-        {{
-            "skill_name": "Python",
-            "importance_rank": 3,
-            "required_proficiency_level": "intermediate",
-            "category": "programming_language",
-            "mentions_count": 2,
-            "context_clues": ["experience with Python"]
-        }}
-    ],
-    "job_level": "senior",
-    "overall_difficulty": 8
-}}
-
-IMPORTANT: Return ONLY the JSON object, no additional text, markdown formatting, or code blocks.
-"""
+    extraction_prompt = build_skill_extraction_prompt(job_description)
 
     try:
-        # Invoke LLM
-        response = llm_instance.invoke(extraction_prompt)
-        structured_json = response.content.strip()
+        # Invoke LLM (structured output: the provider returns a validated JobSkillAnalysis)
+        analysis = llm_instance.with_structured_output(JobSkillAnalysis).invoke(extraction_prompt)
+    except Exception as e:
+        logger.exception("[ERROR] Error analyzing job description skills: %s", e)
+        return create_fallback_analysis(job_description)
 
-        # Clean response
-        if structured_json.startswith("```json"):
-            structured_json = structured_json.replace("```json", "").replace("```", "").strip()
-        elif structured_json.startswith("```"):
-            structured_json = structured_json.replace("```", "").strip()
+    return _finalize_analysis(job_description, analysis, cache_dir, cache_key)
 
-        # Parse JSON
-        parsed_data = json.loads(structured_json)
 
-        # Create and return JobSkillAnalysis
-        return JobSkillAnalysis(**parsed_data)
+async def analyze_job_descriptions_batch(
+    job_descriptions: List[str],
+    llm_instance=None,
+    cache_dir: Optional[str] = None,
+    concurrency: int = SKILL_ANALYSIS_CONCURRENCY
+) -> List[JobSkillAnalysis]:
+    """
+    Analyze several job descriptions with concurrent LLM requests
 
-    except json.JSONDecodeError as e:
-        print(f"JSON decode error in job skill analysis: {e}")
-        print(f"LLM response (first 500 chars): {structured_json[:500]}")
-        return create_fallback_analysis(job_description)
-    except Exception as e:
-        print(f"Error analyzing job description skills: {e}")
+    Cached and duplicate descriptions are resolved without extra requests;
+    the rest are sent concurrently, at most `concurrency` at a time.
+
+    Args:
+        job_descriptions: Job description texts
+        llm_instance: Optional LLM instance (uses the shared LLM if not provided)
+        cache_dir: Directory for cached analyses (optional)
+        concurrency: Maximum number of LLM requests in flight
+
+    Returns:
+        One JobSkillAnalysis per job description, in input order
+    """
+    if llm_instance is None:
+        llm_instance = get_llm()
+
+    keys = [make_skill_cache_key(job_description) for job_description in job_descriptions]
+    analyses: Dict[str, JobSkillAnalysis] = {}
+    pending: Dict[str, str] = {}
+
+    for key, job_description in zip(keys, job_descriptions):
+        if key in analyses or key in pending:
+            continue
+        if is_degenerate_job_description(job_description):
+            analyses[key] = create_fallback_analysis(job_description)
+            continue
+        cached = load_cached_analysis(cache_dir, key)
+        if cached is not None:
+            analyses[key] = cached
+        else:
+            pending[key] = job_description
+
+    if pending:
+        logger.info("[INFO] Analyzing %d job descriptions concurrently...", len(pending))
+        structured_llm = llm_instance.with_structured_output(JobSkillAnalysis)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def extract(job_description: str) -> Optional[JobSkillAnalysis]:
+            async with semaphore:
+                return await asyncio.to_thread(structured_llm.invoke, build_skill_extraction_prompt(job_description))
+
+        responses = await asyncio.gather(
+            *(extract(job_description) for job_description in pending.values()),
+            return_exceptions=True
+        )
+
+        for (key, job_description), response in zip(pending.items(), responses):
+            if isinstance(response, Exception):
+                logger.error("[ERROR] Error analyzing job description skills: %s", response, exc_info=response)
+                analyses[key] = create_fallback_analysis(job_description)
+            else:
+                analyses[key] = _finalize_analysis(job_description, response, cache_dir, key)
+
+    return [analyses[key] for key in keys]
+
+
+def _finalize_analysis(
+    job_description: str,
+    analysis: Optional[JobSkillAnalysis],
+    cache_dir: Optional[str],
+    cache_key: str
+) -> JobSkillAnalysis:
+    """
+    Cache a structured LLM result, or fall back to keyword analysis when there is none
+
+    Args:
+        job_description: The job description text (for the fallback)
+        analysis: Structured output from the LLM (None if the model returned no result)
+        cache_dir: Directory for cached analyses (optional)
+        cache_key: Key from make_skill_cache_key()
+
+    Returns:
+        JobSkillAnalysis
+    """
+    if analysis is None:
+        logger.error("[ERROR] Error analyzing job description skills: LLM returned no structured result")
         return create_fallback_analysis(job_description)
 
+    store_cached_analysis(cache_dir, cache_key, analysis)
+    return analysis
+
+
+# Keywords for the fallback analysis (plain substring matches)
+FALLBACK_DB_KEYWORDS = frozenset({'sql', 'database', 'postgresql', 'mysql', 'mongodb', 'oracle', 'nosql'})
+
+# (technology, keywords that indicate it)
+FALLBACK_DB_TECHNOLOGIES = (
+    ('SQL', frozenset({'sql', 'postgresql', 'mysql'})),
+    ('MongoDB', frozenset({'mongodb', 'nosql'})),
+)
+
+# (skill name, importance rank, keywords that indicate it); Python is the default
+FALLBACK_LANGUAGES = (
+    ('Python', 1, frozenset({'python'})),
+    ('JavaScript', 2, frozenset({'javascript', 'js'})),
+)
+
+FALLBACK_KEYWORDS = FALLBACK_DB_KEYWORDS.union(*(keywords for _, _, keywords in FALLBACK_LANGUAGES))
+
+
+def _fallback_language_skill(skill_name: str, importance_rank: int) -> SkillImportance:
+    """Programming language entry used by the fallback analysis"""
+    return SkillImportance(
+        skill_name=skill_name,
+        importance_rank=importance_rank,
+        required_proficiency_level="intermediate",
+        category="programming_language",
+        mentions_count=1
+    )
+
 
 def create_fallback_analysis(job_description: str) -> JobSkillAnalysis:
     """Create basic fallback analysis when LLM extraction fails"""
-    # Simple keyword-based extraction as fallback
+    # Simple keyword-based extraction as fallback: scan for each keyword once
     job_lower = job_description.lower()
+    found = {keyword for keyword in FALLBACK_KEYWORDS if keyword in job_lower}
 
     # Check for database requirement
-    db_keywords = ['sql', 'database', 'postgresql', 'mysql', 'mongodb', 'oracle', 'nosql']
-    has_db = any(keyword in job_lower for keyword in db_keywords)
-
-    db_techs = []
-    if 'sql' in job_lower or 'postgresql' in job_lower or 'mysql' in job_lower:
-        db_techs.append('SQL')
-    if 'mongodb' in job_lower or 'nosql' in job_lower:
-        db_techs.append('MongoDB')
-
-    # Basic programming language detection
-    primary_skills = []
-    if 'python' in job_lower:
-        primary_skills.append(SkillImportance(
-            skill_name="Python",
-            importance_rank=1,
-            required_proficiency_level="intermediate",
-            category="programming_language",
-            mentions_count=1,
-            context_clues=[]
-        ))
-
-    if 'javascript' in job_lower or 'js' in job_lower:
-        primary_skills.append(SkillImportance(
-            skill_name="JavaScript",
-            importance_rank=2,
-            required_proficiency_level="intermediate",
-            category="programming_language",
-            mentions_count=1,
-            context_clues=[]
-        ))
-
-    # Default to Python if nothing found
-    if not primary_skills:
-        primary_skills.append(SkillImportance(
-            skill_name="Python",
-            importance_rank=1,
-            required_proficiency_level="intermediate",
-            category="programming_language",
-            mentions_count=1,
-            context_clues=[]
-        ))
+    has_db = not found.isdisjoint(FALLBACK_DB_KEYWORDS)
+    db_techs = [tech for tech, keywords in FALLBACK_DB_TECHNOLOGIES if not found.isdisjoint(keywords)]
+
+    # Basic programming language detection (default to Python if nothing found)
+    primary_skills = [
+        _fallback_language_skill(skill_name, rank)
+        for skill_name, rank, keywords in FALLBACK_LANGUAGES
+        if not found.isdisjoint(keywords)
+    ] or [_fallback_language_skill('Python', 1)]
 
     return JobSkillAnalysis(
-        primary_skills=primary_skills,
-        secondary_skills=[],
-        tertiary_skills=[],
         database_requirement=DatabaseRequirement(
             has_db_requirement=has_db,
             db_technologies=db_techs,
@@ -242,23 +377,33 @@ def save_skill_analysis(analysis: JobSkillAnalysis, output_path: str):
     """Save skill analysis to JSON file"""
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis.model_dump(), f, indent=2, ensure_ascii=False)
-        print(f"✅ Skill analysis saved to: {output_path}")
+            f.write(analysis.model_dump_json(indent=2))
+        logger.info("✅ Skill analysis saved to: %s", output_path)
     except Exception as e:
-        print(f"❌ Error saving skill analysis: {e}")
+        logger.error("❌ Error saving skill analysis: %s", e)
 
 
 def load_skill_analysis(input_path: str) -> Optional[JobSkillAnalysis]:
     """Load skill analysis from JSON file"""
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return JobSkillAnalysis(**data)
+        # Raw bytes go straight to pydantic-core (no str decode, no dict intermediate)
+        with open(input_path, 'rb') as f:
+            return JobSkillAnalysis.model_validate_json(f.read())
     except Exception as e:
-        print(f"Error loading skill analysis: {e}")
+        logger.error("[ERROR] Error loading skill analysis: %s", e)
         return None
 
 
+async def asave_skill_analysis(analysis: JobSkillAnalysis, output_path: str):
+    """Async variant of save_skill_analysis() (file I/O runs off the event loop thread)"""
+    await asyncio.to_thread(save_skill_analysis, analysis, output_path)
+
+
+async def aload_skill_analysis(input_path: str) -> Optional[JobSkillAnalysis]:
+    """Async variant of load_skill_analysis() (file I/O runs off the event loop thread)"""
+    return await asyncio.to_thread(load_skill_analysis, input_path)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test with sample job description
@@ -0,0 +1,70 @@
+"""
+Generated Question Cache
+Content-addressed on-disk cache of LLM question-generation responses so that
+an identical question prompt (same job description, skill, difficulty and
+template) does not call the LLM again
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+from .file_cache import FileCache
+
+# Cache directory name, created inside the coding interviews folder
+QUESTION_CACHE_DIRNAME = '.question_cache'
+
+# Entries older than this are treated as misses (and overwritten on the next store)
+QUESTION_CACHE_TTL_SECONDS = int(os.getenv('CODING_QUESTION_CACHE_TTL_DAYS', '30')) * 24 * 3600
+
+# CODING_QUESTION_CACHE_DISABLE=1 turns the cache off (e.g. while A/B testing prompts)
+_question_cache = FileCache(
+    'question cache',
+    'CODING_QUESTION_CACHE_DISABLE',
+    serialize=lambda response: json.dumps({'response': response}, ensure_ascii=False),
+    deserialize=lambda text: str(json.loads(text)['response']),
+    max_age_seconds=QUESTION_CACHE_TTL_SECONDS
+)
+
+
+def make_question_cache_key(prompt: str) -> str:
+    """
+    Build a cache key from the fully formatted question prompt
+
+    The prompt already contains the job description, skill, difficulty and
+    template text, so any change to those produces a new key.
+
+    Args:
+        prompt: Formatted prompt sent to the LLM
+
+    Returns:
+        Hex sha256 digest of the prompt
+    """
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+
+def load_cached_response(cache_dir: Optional[str], key: str) -> Optional[str]:
+    """
+    Look up a stored LLM response
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        key: Key from make_question_cache_key()
+
+    Returns:
+        Raw LLM response text, or None on a miss or an expired entry
+    """
+    return _question_cache.load(cache_dir, key)
+
+
+def store_cached_response(cache_dir: Optional[str], key: str, response: str) -> None:
+    """
+    Store an LLM response
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        key: Key from make_question_cache_key()
+        response: Raw LLM response text
+    """
+    _question_cache.store(cache_dir, key, response)
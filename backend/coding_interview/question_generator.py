@@ -2,18 +2,26 @@
 Coding Question Generator for AI Interviewer
 Generates progressive difficulty coding questions based on job requirements
 """
+import asyncio
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import yaml
 import os
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml-backed, much faster when available
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Import from shared modules
 from shared.llm_setup import get_llm
 
 # Import job skill analyzer
 from .job_skill_analyzer import JobSkillAnalysis, SkillImportance, DatabaseRequirement
+from .question_cache import make_question_cache_key, load_cached_response, store_cached_response
 
 # Pydantic Models for Coding Questions
 class WorkExperience(BaseModel):
@@ -44,10 +52,21 @@ class DebugCodingQuestion(BaseModel):
     target_language: str = Field(description="Programming language")
     cv_technology: str = Field(description="Technology from CV being tested")
 
-    # Backward compatibility - these will be derived from new fields if not provided
-    description: str = Field(default="", description="[DEPRECATED] Use context_paragraph instead")
-    expected_behavior: str = Field(default="", description="[DEPRECATED] Use expected_outcome instead")
-    context: str = Field(default="", description="[DEPRECATED] Use context_paragraph instead")
+    # Backward compatibility - derived from the structured fields (still serialized)
+    @computed_field(description="[DEPRECATED] Use context_paragraph instead")
+    @property
+    def description(self) -> str:
+        return self.context_paragraph
+
+    @computed_field(description="[DEPRECATED] Use expected_outcome instead")
+    @property
+    def expected_behavior(self) -> str:
+        return self.expected_outcome
+
+    @computed_field(description="[DEPRECATED] Use context_paragraph instead")
+    @property
+    def context(self) -> str:
+        return self.context_paragraph
 
 class ExplanationCodingQuestion(BaseModel):
     title: str = Field(description="Code explanation problem title")
@@ -68,8 +87,11 @@ class ExplanationCodingQuestion(BaseModel):
     cv_technology: str = Field(description="Technology from CV being demonstrated")
     skills_tested: List[str] = Field(default=[], description="Skills being tested")
 
-    # Backward compatibility
-    context: str = Field(default="", description="[DEPRECATED] Use context_paragraph instead")
+    # Backward compatibility - derived from the structured fields (still serialized)
+    @computed_field(description="[DEPRECATED] Use context_paragraph instead")
+    @property
+    def context(self) -> str:
+        return self.context_paragraph
 
 
 class DatabaseSchemaQuestion(BaseModel):
@@ -86,11 +108,26 @@ class DatabaseSchemaQuestion(BaseModel):
     complexity_level: str = Field(description="Complexity level: basic, intermediate, advanced, expert")
     skills_tested: List[str] = Field(default=[], description="Skills being tested")
 
-    # Backward compatibility - map to new fields
-    scenario: str = Field(default="", description="[DEPRECATED] Use context_paragraph instead")
-    task_description: str = Field(default="", description="[DEPRECATED] Use task_instruction instead")
-    expected_deliverable: str = Field(default="", description="[DEPRECATED] Use expected_outcome instead")
-    context: str = Field(default="", description="[DEPRECATED] Use context_paragraph instead")
+    # Backward compatibility - derived from the structured fields (still serialized)
+    @computed_field(description="[DEPRECATED] Use context_paragraph instead")
+    @property
+    def scenario(self) -> str:
+        return self.context_paragraph
+
+    @computed_field(description="[DEPRECATED] Use task_instruction instead")
+    @property
+    def task_description(self) -> str:
+        return self.task_instruction
+
+    @computed_field(description="[DEPRECATED] Use expected_outcome instead")
+    @property
+    def expected_deliverable(self) -> str:
+        return self.expected_outcome
+
+    @computed_field(description="[DEPRECATED] Use context_paragraph instead")
+    @property
+    def context(self) -> str:
+        return self.context_paragraph
 
 class InterviewQuestion(BaseModel):
     question_id: int = Field(description="Question identifier")
@@ -120,13 +157,22 @@ class CodingInterviewState(BaseModel):
     job_skill_analysis: Optional[JobSkillAnalysis] = Field(default=None, description="Structured analysis of job skills")
     question_distribution: Dict[int, Dict[str, Any]] = Field(default={}, description="Maps question number to {skill, difficulty, type}")
     skill_difficulty_map: Dict[str, int] = Field(default={}, description="Maps skill name to job-required difficulty (1-10)")
+    question_cache_dir: Optional[str] = Field(default=None, description="Directory for cached question responses (None disables caching)")
+
+# Maximum number of questions generated (LLM calls in flight) at once
+QUESTION_GENERATION_CONCURRENCY = int(os.getenv('QUESTION_GENERATION_CONCURRENCY', '5'))
+
+@lru_cache(maxsize=1)
+def _read_coding_prompts() -> Dict[str, Any]:
+    """Parse the prompts YAML once per process (call .cache_clear() to reload)"""
+    prompts_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'coding_prompts.yaml')
+    with open(prompts_path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=YamlLoader)
 
 def load_coding_prompts():
-    """Load coding-specific prompts from YAML file"""
+    """Load coding-specific prompts from YAML file (cached; failures are retried on the next call)"""
     try:
-        prompts_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'coding_prompts.yaml')
-        with open(prompts_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        return _read_coding_prompts()
     except Exception as e:
         print(f"Error loading coding prompts: {e}")
         return None
@@ -138,18 +184,32 @@ def get_prompt_template(category: str, prompt_type: str) -> Optional[str]:
         return prompts[category][prompt_type]
     return None
 
+# Difficulty description for each score 1-10 (index 0 unused)
+DIFFICULTY_DESCRIPTIONS = (
+    "",
+    "entry-level/junior", "entry-level/junior",
+    "junior to mid-level", "junior to mid-level",
+    "mid-level", "mid-level",
+    "senior-level", "senior-level",
+    "expert/principal-level", "expert/principal-level"
+)
+
 def get_difficulty_description(difficulty_score: int) -> str:
-    """Get difficulty description from score"""
-    if difficulty_score <= 2:
-        return "entry-level/junior"
-    elif difficulty_score <= 4:
-        return "junior to mid-level"
-    elif difficulty_score <= 6:
-        return "mid-level"
-    elif difficulty_score <= 8:
-        return "senior-level"
-    else:
-        return "expert/principal-level"
+    """Get difficulty description from score (clamped to 1-10)"""
+    return DIFFICULTY_DESCRIPTIONS[max(1, min(10, difficulty_score))]
+
+
+# Base question difficulty for each required proficiency level
+PROFICIENCY_DIFFICULTY = {
+    "expert": 9,
+    "advanced": 7,
+    "intermediate": 5,
+    "basic": 3,
+    "familiarity": 2
+}
+
+# Context clue words that push a skill's difficulty up by one
+DIFFICULTY_CONTEXT_KEYWORDS = ("deep", "extensive", "mastery", "complex")
 
 
 def extract_skill_difficulty_from_job(skill: SkillImportance, job_description: str) -> int:
@@ -168,15 +228,7 @@ def extract_skill_difficulty_from_job(skill: SkillImportance, job_description: s
     importance_rank = skill.importance_rank
 
     # Base difficulty from proficiency level
-    proficiency_map = {
-        "expert": 9,
-        "advanced": 7,
-        "intermediate": 5,
-        "basic": 3,
-        "familiarity": 2
-    }
-
-    base_difficulty = proficiency_map.get(proficiency_level, 5)
+    base_difficulty = PROFICIENCY_DIFFICULTY.get(proficiency_level, 5)
 
     # Adjust based on importance rank (more important = higher difficulty to test thoroughly)
     if importance_rank == 1:  # Critical skill
@@ -187,13 +239,15 @@ def extract_skill_difficulty_from_job(skill: SkillImportance, job_description: s
         base_difficulty = max(1, base_difficulty - 1)
 
     # Check context clues for additional indicators
-    context_text = " ".join(skill.context_clues).lower()
-    if any(keyword in context_text for keyword in ["deep", "extensive", "mastery", "complex"]):
-        base_difficulty = min(10, base_difficulty + 1)
+    if skill.context_clues:
+        context_text = " ".join(skill.context_clues).lower()
+        if any(keyword in context_text for keyword in DIFFICULTY_CONTEXT_KEYWORDS):
+            base_difficulty = min(10, base_difficulty + 1)
 
     return max(1, min(10, base_difficulty))
 
 
+@lru_cache(maxsize=256)
 def calculate_progressive_difficulty(
     question_number: int,
     target_difficulty: int,
@@ -209,7 +263,8 @@ def calculate_progressive_difficulty(
         total_questions: Total number of questions in interview (default 5)
 
     Returns:
-        int: Difficulty score for this specific question (1-10)
+        int: Difficulty score for this specific question (1-10); memoized, since
+        every interview with the same target walks the same curve
 
     Examples:
         With target_difficulty=8, total_questions=5:
@@ -249,13 +304,11 @@ def build_skill_difficulty_map(job_skill_analysis: JobSkillAnalysis) -> Dict[str
     Returns:
         Dict mapping skill name to difficulty (1-10)
     """
-    skill_difficulty_map = {}
-
-    for skill in job_skill_analysis.all_ranked_skills:
-        difficulty = extract_skill_difficulty_from_job(skill, "")  # Context already in skill object
-        skill_difficulty_map[skill.skill_name.lower()] = difficulty
-
-    return skill_difficulty_map
+    # Context is already in each skill object, so no job description is passed
+    return {
+        skill.skill_name.lower(): extract_skill_difficulty_from_job(skill, "")
+        for skill in job_skill_analysis.all_ranked_skills
+    }
 
 
 def create_question_distribution_plan(
@@ -308,93 +361,44 @@ def create_question_distribution_plan(
     print(f"\n🎯 Progressive Difficulty Target: {target_difficulty}/10")
 
     # Normalize CV technologies for comparison
-    cv_tech_lower = [tech.lower() for tech in cv_technologies]
-
-    # Q1-Q2: Top-ranked skill (most critical) with progressive difficulty
-    top_skill = all_skills[0] if len(all_skills) > 0 else None
-    if top_skill:
-        # Determine question type based on skill category
-        q1_type = determine_question_type_for_skill(top_skill, 1)
-        q2_type = determine_question_type_for_skill(top_skill, 2)
-
-        # NEW: Calculate progressive difficulty for Q1
-        q1_difficulty = calculate_progressive_difficulty(1, target_difficulty, total_questions)
-        question_plan[1] = {
-            "skill_name": top_skill.skill_name,
-            "difficulty": q1_difficulty,  # Progressive difficulty
-            "question_type": q1_type,
-            "importance_rank": top_skill.importance_rank,
-            "proficiency_level": top_skill.required_proficiency_level
-        }
+    cv_tech_lower = {tech.lower() for tech in cv_technologies}
 
-        # NEW: Calculate progressive difficulty for Q2
-        q2_difficulty = calculate_progressive_difficulty(2, target_difficulty, total_questions)
-        question_plan[2] = {
-            "skill_name": top_skill.skill_name,
-            "difficulty": q2_difficulty,  # Progressive difficulty
-            "question_type": q2_type,
-            "importance_rank": top_skill.importance_rank,
-            "proficiency_level": top_skill.required_proficiency_level
-        }
+    # Q5: Important skill from job+CV intersection (to test CV claims);
+    # if no intersection, use 4th ranked skill or fallback
+    intersection_skill = next(
+        (skill for skill in all_skills if skill.skill_name.lower() in cv_tech_lower),
+        all_skills[3] if len(all_skills) > 3 else all_skills[0]
+    )
 
-    # Q3: Second-ranked skill with progressive difficulty
-    second_skill = all_skills[1] if len(all_skills) > 1 else all_skills[0]
-    if second_skill:
-        q3_type = determine_question_type_for_skill(second_skill, 3)
-
-        # NEW: Calculate progressive difficulty for Q3
-        q3_difficulty = calculate_progressive_difficulty(3, target_difficulty, total_questions)
-        question_plan[3] = {
-            "skill_name": second_skill.skill_name,
-            "difficulty": q3_difficulty,  # Progressive difficulty
-            "question_type": q3_type,
-            "importance_rank": second_skill.importance_rank,
-            "proficiency_level": second_skill.required_proficiency_level
-        }
+    # Q1-Q2: top-ranked skill (most critical), Q3: second-ranked skill,
+    # Q4: another important skill (3rd ranked), Q5: job+CV intersection
+    plan_skills = (
+        all_skills[0],
+        all_skills[0],
+        all_skills[1] if len(all_skills) > 1 else all_skills[0],
+        all_skills[2] if len(all_skills) > 2 else all_skills[0],
+        intersection_skill
+    )
 
-    # Q4: Another important skill (3rd or 4th ranked) with progressive difficulty
-    third_skill = all_skills[2] if len(all_skills) > 2 else all_skills[0]
-    if third_skill:
-        q4_type = determine_question_type_for_skill(third_skill, 4)
-
-        # NEW: Calculate progressive difficulty for Q4
-        q4_difficulty = calculate_progressive_difficulty(4, target_difficulty, total_questions)
-        question_plan[4] = {
-            "skill_name": third_skill.skill_name,
-            "difficulty": q4_difficulty,  # Progressive difficulty
-            "question_type": q4_type,
-            "importance_rank": third_skill.importance_rank,
-            "proficiency_level": third_skill.required_proficiency_level
+    for question_number, skill in enumerate(plan_skills, 1):
+        question_plan[question_number] = {
+            "skill_name": skill.skill_name,
+            "difficulty": calculate_progressive_difficulty(question_number, target_difficulty, total_questions),
+            "question_type": determine_question_type_for_skill(skill, question_number),
+            "importance_rank": skill.importance_rank,
+            "proficiency_level": skill.required_proficiency_level
         }
 
-    # Q5: Important skill from job+CV intersection (to test CV claims) with progressive difficulty
-    intersection_skill = None
-    for skill in all_skills:
-        if skill.skill_name.lower() in cv_tech_lower:
-            intersection_skill = skill
-            break
-
-    # If no intersection, use 4th ranked skill or fallback
-    if not intersection_skill:
-        intersection_skill = all_skills[3] if len(all_skills) > 3 else all_skills[0]
-
-    if intersection_skill:
-        q5_type = determine_question_type_for_skill(intersection_skill, 5)
-
-        # NEW: Calculate progressive difficulty for Q5 (reaches target difficulty)
-        q5_difficulty = calculate_progressive_difficulty(5, target_difficulty, total_questions)
-        question_plan[5] = {
-            "skill_name": intersection_skill.skill_name,
-            "difficulty": q5_difficulty,  # Progressive difficulty (full target)
-            "question_type": q5_type,
-            "importance_rank": intersection_skill.importance_rank,
-            "proficiency_level": intersection_skill.required_proficiency_level,
-            "cv_verification": True  # Flag to indicate this tests CV claims
-        }
+    # Flag to indicate the last question tests CV claims
+    question_plan[len(plan_skills)]["cv_verification"] = True
 
     return question_plan
 
 
+# Lower-cased skill names treated as database skills whatever their category
+DB_SKILL_NAMES = frozenset({'sql', 'postgresql', 'mysql', 'mongodb', 'nosql', 'redis'})
+
+
 def determine_question_type_for_skill(skill: SkillImportance, question_number: int) -> str:
     """
     Determine appropriate question type based on skill category and question number.
@@ -409,7 +413,7 @@ def determine_question_type_for_skill(skill: SkillImportance, question_number: i
     category = skill.category.lower()
 
     # Database skills get special treatment
-    if category == "database" or skill.skill_name.lower() in ['sql', 'postgresql', 'mysql', 'mongodb', 'nosql', 'redis']:
+    if category == "database" or skill.skill_name.lower() in DB_SKILL_NAMES:
         # Alternate between schema design and debugging for database questions
         if question_number % 2 == 1:
             return "db_schema"
@@ -422,78 +426,101 @@ def determine_question_type_for_skill(skill: SkillImportance, question_number: i
     else:
         return "explain"
 
+
+# Skills that can be used directly as the language of a debug/explanation question
+CODING_LANGUAGES = frozenset({'Python', 'JavaScript', 'Java', 'C#', 'Go', 'Rust', 'TypeScript'})
+
+# Upper-cased skills that can be used directly as the technology of a DB schema question
+DB_SCHEMA_TECHNOLOGIES = frozenset({'SQL', 'MONGODB', 'POSTGRESQL', 'MYSQL', 'NOSQL'})
+
+
+# Bugs to inject for each difficulty 1-10 (index 0 unused):
+# easy (1-3): 1 error, medium (4-7): 2 errors, hard (8-10): 3 errors
+ERROR_COUNT_BY_DIFFICULTY = (0, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3)
+
+
 def determine_error_count_by_difficulty(difficulty_level: int) -> int:
-    """Determine number of errors to inject based on difficulty level"""
-    if difficulty_level <= 3:
-        return 1  # Easy: 1 error
-    elif difficulty_level <= 7:
-        return 2  # Medium: 2 errors
-    else:
-        return 3  # Hard: 3 errors
+    """Determine number of errors to inject based on difficulty level (clamped to 1-10)"""
+    return ERROR_COUNT_BY_DIFFICULTY[max(1, min(10, difficulty_level))]
 
 
-def parse_debug_response(raw_response: str, target_language: str, cv_technology: str, error_count: int) -> DebugCodingQuestion:
-    """Parse debug coding response from LLM with new structured format"""
-    try:
-        lines = raw_response.split('\n')
-        title = ""
-        context_paragraph = ""
-        task_instruction = ""
-        expected_outcome = ""
-        expected_output = ""
-        buggy_code = ""
+# Section headers shared by the debug and explanation response formats,
+# mapped to the key they are stored under by _parse_structured_response()
+_SECTION_HEADERS = {
+    "**Problem Title:**": "title",
+    "**Context:**": "context",
+    "**Your Task:**": "task",
+    "**Expected Outcome:**": "outcome",
+    "**Expected Output:**": "expected_output",
+}
 
-        current_section = None
-        code_block = False
 
-        for line in lines:
-            line_stripped = line.strip()
+def _parse_structured_response(raw_response: str, code_header: str) -> Dict[str, str]:
+    """
+    Split a debug/explanation LLM response into its sections in one pass
+
+    Text sections continue over following non-header lines (joined with
+    spaces); the code section collects the fenced block after code_header.
+
+    Args:
+        raw_response: Raw LLM response text
+        code_header: Header that introduces the code block (e.g. "**Buggy Code:**")
 
-            if line_stripped.startswith("**Problem Title:**"):
-                title = line_stripped.replace("**Problem Title:**", "").strip()
-            elif line_stripped.startswith("**Context:**"):
-                context_paragraph = line_stripped.replace("**Context:**", "").strip()
-                current_section = "context"
-            elif line_stripped.startswith("**Buggy Code:**"):
+    Returns:
+        Dict with title, context, task, outcome, expected_output and code ("" when missing)
+    """
+    sections: Dict[str, List[str]] = {}
+    code_lines: List[str] = []
+    current_section = None
+    code_block = False
+
+    for line in raw_response.split('\n'):
+        line_stripped = line.strip()
+
+        if line_stripped.startswith("**"):
+            # Every header ends in ":**", so the text up to the first ":**" identifies it
+            header = line_stripped[:line_stripped.find(":**") + 3]
+            if header == code_header:
                 current_section = "code"
-            elif line_stripped.startswith("**Your Task:**"):
-                task_instruction = line_stripped.replace("**Your Task:**", "").strip()
-                current_section = "task"
-            elif line_stripped.startswith("**Expected Outcome:**"):
-                expected_outcome = line_stripped.replace("**Expected Outcome:**", "").strip()
-                current_section = "outcome"
-            elif line_stripped.startswith("**Expected Output:**"):
-                expected_output = line_stripped.replace("**Expected Output:**", "").strip()
-                current_section = "expected_output"
-            elif line_stripped.startswith("```"):
-                code_block = not code_block
-                if not code_block:
-                    current_section = None
-            elif code_block and current_section == "code":
-                if buggy_code:
-                    buggy_code += "\n" + line
-                else:
-                    buggy_code = line
-            elif current_section == "context" and line_stripped and not line_stripped.startswith("**"):
-                if context_paragraph:
-                    context_paragraph += " " + line_stripped
-                else:
-                    context_paragraph = line_stripped
-            elif current_section == "task" and line_stripped and not line_stripped.startswith("**"):
-                if task_instruction:
-                    task_instruction += " " + line_stripped
-                else:
-                    task_instruction = line_stripped
-            elif current_section == "outcome" and line_stripped and not line_stripped.startswith("**"):
-                if expected_outcome:
-                    expected_outcome += " " + line_stripped
-                else:
-                    expected_outcome = line_stripped
-            elif current_section == "expected_output" and line_stripped and not line_stripped.startswith("**"):
-                if expected_output:
-                    expected_output += " " + line_stripped
-                else:
-                    expected_output = line_stripped
+                continue
+            section = _SECTION_HEADERS.get(header)
+            if section is not None:
+                content = line_stripped.replace(header, "").strip()
+                sections[section] = [content] if content else []
+                if section != "title":
+                    current_section = section
+                continue
+            # Other bold lines are only kept inside the code block
+            if code_block and current_section == "code" and (code_lines or line):
+                code_lines.append(line)
+        elif line_stripped.startswith("```"):
+            code_block = not code_block
+            if not code_block:
+                current_section = None
+        elif code_block and current_section == "code":
+            # Leading empty lines are dropped
+            if code_lines or line:
+                code_lines.append(line)
+        elif current_section is not None and current_section != "code" and line_stripped:
+            sections[current_section].append(line_stripped)
+
+    parsed = {name: " ".join(parts) for name, parts in sections.items()}
+    parsed["code"] = "\n".join(code_lines)
+    for name in _SECTION_HEADERS.values():
+        parsed.setdefault(name, "")
+    return parsed
+
+
+def parse_debug_response(raw_response: str, target_language: str, cv_technology: str, error_count: int) -> DebugCodingQuestion:
+    """Parse debug coding response from LLM with new structured format"""
+    try:
+        sections = _parse_structured_response(raw_response, "**Buggy Code:**")
+        title = sections["title"]
+        context_paragraph = sections["context"]
+        task_instruction = sections["task"]
+        expected_outcome = sections["outcome"]
+        expected_output = sections["expected_output"]
+        buggy_code = sections["code"]
 
         return DebugCodingQuestion(
             title=title or f"Debug {target_language} Code",
@@ -508,11 +535,7 @@ def parse_debug_response(raw_response: str, target_language: str, cv_technology:
             error_types=["logic", "syntax"],
             hints=[],
             target_language=target_language,
-            cv_technology=cv_technology,
-            # Backward compatibility - populate old fields from new ones
-            description=context_paragraph or f"Fix the bugs in this {target_language} code",
-            expected_behavior=expected_outcome or "Code should run without errors",
-            context=context_paragraph or f"This code might be used in a {cv_technology} application"
+            cv_technology=cv_technology
         )
     except Exception as e:
         print(f"Error parsing debug response: {e}")
@@ -531,83 +554,30 @@ def parse_debug_response(raw_response: str, target_language: str, cv_technology:
             error_types=["logic"],
             hints=[],
             target_language=target_language,
-            cv_technology=cv_technology,
-            description=fallback_context,
-            expected_behavior=fallback_outcome,
-            context=fallback_context
+            cv_technology=cv_technology
         )
 
+# Numbered points ("1) ...", "(2) ...") in an explanation task instruction
+_ANALYSIS_QUESTION_RE = re.compile(r'\(?\d+\)[:\s]+(.*?)(?=\(?\d+\)|$)', re.DOTALL)
+
 def parse_explanation_response(raw_response: str, target_language: str, cv_technology: str) -> ExplanationCodingQuestion:
     """Parse explanation coding response from LLM with new structured format"""
     try:
-        lines = raw_response.split('\n')
-        title = ""
-        context_paragraph = ""
-        task_instruction = ""
-        expected_outcome = ""
-        expected_output = ""
-        working_code = ""
+        sections = _parse_structured_response(raw_response, "**Code to Analyze:**")
+        title = sections["title"]
+        context_paragraph = sections["context"]
+        task_instruction = sections["task"]
+        expected_outcome = sections["outcome"]
+        expected_output = sections["expected_output"]
+        working_code = sections["code"]
         analysis_questions = []
 
-        current_section = None
-        code_block = False
-
-        for line in lines:
-            line_stripped = line.strip()
-
-            if line_stripped.startswith("**Problem Title:**"):
-                title = line_stripped.replace("**Problem Title:**", "").strip()
-            elif line_stripped.startswith("**Context:**"):
-                context_paragraph = line_stripped.replace("**Context:**", "").strip()
-                current_section = "context"
-            elif line_stripped.startswith("**Code to Analyze:**"):
-                current_section = "code"
-            elif line_stripped.startswith("**Your Task:**"):
-                task_instruction = line_stripped.replace("**Your Task:**", "").strip()
-                current_section = "task"
-            elif line_stripped.startswith("**Expected Outcome:**"):
-                expected_outcome = line_stripped.replace("**Expected Outcome:**", "").strip()
-                current_section = "outcome"
-            elif line_stripped.startswith("**Expected Output:**"):
-                expected_output = line_stripped.replace("**Expected Output:**", "").strip()
-                current_section = "expected_output"
-            elif line_stripped.startswith("```"):
-                code_block = not code_block
-                if not code_block:
-                    current_section = None
-            elif code_block and current_section == "code":
-                if working_code:
-                    working_code += "\n" + line
-                else:
-                    working_code = line
-            elif current_section == "context" and line_stripped and not line_stripped.startswith("**"):
-                if context_paragraph:
-                    context_paragraph += " " + line_stripped
-                else:
-                    context_paragraph = line_stripped
-            elif current_section == "task" and line_stripped and not line_stripped.startswith("**"):
-                if task_instruction:
-                    task_instruction += " " + line_stripped
-                else:
-                    task_instruction = line_stripped
-            elif current_section == "outcome" and line_stripped and not line_stripped.startswith("**"):
-                if expected_outcome:
-                    expected_outcome += " " + line_stripped
-                else:
-                    expected_outcome = line_stripped
-            elif current_section == "expected_output" and line_stripped and not line_stripped.startswith("**"):
-                if expected_output:
-                    expected_output += " " + line_stripped
-                else:
-                    expected_output = line_stripped
-
         # Extract analysis questions from task if present (for backward compatibility)
         if task_instruction:
             # Try to extract numbered points as individual questions
-            question_pattern = r'\(?\d+\)[:\s]+(.*?)(?=\(?\d+\)|$)'
-            matches = re.findall(question_pattern, task_instruction, re.DOTALL)
+            matches = _ANALYSIS_QUESTION_RE.findall(task_instruction)
             if matches:
-                analysis_questions = [q.strip().rstrip(',') for q in matches if q.strip()]
+                analysis_questions = [stripped.rstrip(',') for q in matches if (stripped := q.strip())]
 
         return ExplanationCodingQuestion(
             title=title or f"Analyze {target_language} Code",
@@ -622,9 +592,7 @@ def parse_explanation_response(raw_response: str, target_language: str, cv_techn
             key_concepts=[target_language, cv_technology],
             target_language=target_language,
             cv_technology=cv_technology,
-            skills_tested=[target_language, "Code Analysis"],
-            # Backward compatibility
-            context=context_paragraph or f"This code might be used in a {cv_technology} application"
+            skills_tested=[target_language, "Code Analysis"]
         )
     except Exception as e:
         print(f"Error parsing explanation response: {e}")
@@ -643,10 +611,34 @@ def parse_explanation_response(raw_response: str, target_language: str, cv_techn
             key_concepts=[target_language],
             target_language=target_language,
             cv_technology=cv_technology,
-            skills_tested=[target_language, "Code Analysis"],
-            context=fallback_context
+            skills_tested=[target_language, "Code Analysis"]
         )
 
+def generate_question_text(prompt: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Get the LLM response for a question prompt, reusing a cached response when available
+
+    Args:
+        prompt: Fully formatted question prompt
+        cache_dir: Directory for cached responses (None disables caching)
+
+    Returns:
+        Raw LLM response text
+    """
+    cache_key = make_question_cache_key(prompt)
+    cached = load_cached_response(cache_dir, cache_key)
+    if cached is not None:
+        print(f"[INFO] Reusing cached question response {cache_key[:12]}")
+        return cached
+
+    response_text = get_llm().invoke(prompt).content
+
+    # Only keep responses in the expected structured format, so a malformed
+    # answer is regenerated next time instead of being replayed
+    if "**Problem Title:**" in response_text:
+        store_cached_response(cache_dir, cache_key, response_text)
+    return response_text
+
 def generate_debug_question(state: CodingInterviewState, question_number: int) -> InterviewQuestion:
     """Generate a debugging coding question using skill-weighted approach"""
     # Get question plan for this question number
@@ -660,7 +652,7 @@ def generate_debug_question(state: CodingInterviewState, question_number: int) -
 
     # Determine question parameters based on job-centric difficulty
     error_count = determine_error_count_by_difficulty(difficulty)
-    target_language = skill_name if skill_name in ['Python', 'JavaScript', 'Java', 'C#', 'Go', 'Rust', 'TypeScript'] else "Python"
+    target_language = skill_name if skill_name in CODING_LANGUAGES else "Python"
     cv_technology = skill_name
 
     # Get debug prompt template
@@ -682,10 +674,9 @@ Create a {target_language} code snippet with {error_count} logical error(s).
         error_count=error_count
     )
 
-    # Generate using LLM
-    llm = get_llm()
-    response = llm.invoke(formatted_prompt)
-    debug_data = parse_debug_response(response.content, target_language, cv_technology, error_count)
+    # Generate using LLM (or reuse the response to an identical prompt)
+    response_text = generate_question_text(formatted_prompt, state.question_cache_dir)
+    debug_data = parse_debug_response(response_text, target_language, cv_technology, error_count)
 
     return InterviewQuestion(
         question_id=question_number,  # FIXED: Use question_number instead of state.current_question_count + 1
@@ -697,55 +688,54 @@ Create a {target_language} code snippet with {error_count} logical error(s).
         timestamp=datetime.now().isoformat()
     )
 
+# Text section headers of the database schema response format (the
+# "**Requirements:**" list is handled separately)
+_DB_SECTION_HEADERS = {
+    "**Problem Title:**": "title",
+    "**Context:**": "context",
+    "**Your Task:**": "task",
+    "**Expected Outcome:**": "outcome",
+}
+
 def parse_db_schema_response(raw_response: str, db_technology: str, complexity_level: str) -> DatabaseSchemaQuestion:
     """Parse database schema response from LLM with new structured format"""
     try:
-        lines = raw_response.split('\n')
-        title = ""
-        context_paragraph = ""
-        task_instruction = ""
-        expected_outcome = ""
+        sections: Dict[str, List[str]] = {}
         requirements = []
 
         current_section = None
 
-        for line in lines:
+        for line in raw_response.split('\n'):
             line_stripped = line.strip()
-
-            if line_stripped.startswith("**Problem Title:**"):
-                title = line_stripped.replace("**Problem Title:**", "").strip()
-            elif line_stripped.startswith("**Context:**"):
-                context_paragraph = line_stripped.replace("**Context:**", "").strip()
-                current_section = "context"
-            elif line_stripped.startswith("**Your Task:**"):
-                task_instruction = line_stripped.replace("**Your Task:**", "").strip()
-                current_section = "task"
-            elif line_stripped.startswith("**Requirements:**"):
-                current_section = "requirements"
-            elif line_stripped.startswith("**Expected Outcome:**"):
-                expected_outcome = line_stripped.replace("**Expected Outcome:**", "").strip()
-                current_section = "outcome"
-            elif current_section == "context" and line_stripped and not line_stripped.startswith("**"):
-                if context_paragraph:
-                    context_paragraph += " " + line_stripped
-                else:
-                    context_paragraph = line_stripped
-            elif current_section == "task" and line_stripped and not line_stripped.startswith("**"):
-                if task_instruction:
-                    task_instruction += " " + line_stripped
-                else:
-                    task_instruction = line_stripped
-            elif current_section == "requirements" and line_stripped and not line_stripped.startswith("**"):
+            if not line_stripped:
+                continue
+
+            if line_stripped.startswith("**"):
+                # Every header ends in ":**", so the text up to the first ":**" identifies it
+                header = line_stripped[:line_stripped.find(":**") + 3]
+                if header == "**Requirements:**":
+                    current_section = "requirements"
+                    continue
+                section = _DB_SECTION_HEADERS.get(header)
+                if section is not None:
+                    content = line_stripped.replace(header, "").strip()
+                    sections[section] = [content] if content else []
+                    if section != "title":
+                        current_section = section
+                # Other bold lines are skipped
+            elif current_section == "requirements":
                 # Handle list items
-                if line_stripped.startswith("-") or line_stripped.startswith("•"):
+                if line_stripped.startswith(("-", "•")):
                     requirements.append(line_stripped.lstrip("- •").strip())
                 elif requirements:
                     requirements[-1] += " " + line_stripped
-            elif current_section == "outcome" and line_stripped and not line_stripped.startswith("**"):
-                if expected_outcome:
-                    expected_outcome += " " + line_stripped
-                else:
-                    expected_outcome = line_stripped
+            elif current_section is not None:
+                sections[current_section].append(line_stripped)
+
+        title = " ".join(sections.get("title", ()))
+        context_paragraph = " ".join(sections.get("context", ()))
+        task_instruction = " ".join(sections.get("task", ()))
+        expected_outcome = " ".join(sections.get("outcome", ()))
 
         return DatabaseSchemaQuestion(
             title=title or f"Database Design Challenge - {db_technology}",
@@ -757,12 +747,7 @@ def parse_db_schema_response(raw_response: str, db_technology: str, complexity_l
             requirements=requirements or ["Design an appropriate database schema"],
             db_technology=db_technology,
             complexity_level=complexity_level,
-            skills_tested=[db_technology, "Database Design", "Data Modeling"],
-            # Backward compatibility - populate old fields from new ones
-            scenario=context_paragraph or f"Design a database solution using {db_technology}",
-            task_description=task_instruction or f"Create a database design for this scenario",
-            expected_deliverable=expected_outcome or "Schema design with tables, relationships, and constraints",
-            context=context_paragraph or f"This tests your {db_technology} database design skills"
+            skills_tested=[db_technology, "Database Design", "Data Modeling"]
         )
     except Exception as e:
         print(f"Error parsing database schema response: {e}")
@@ -778,11 +763,7 @@ def parse_db_schema_response(raw_response: str, db_technology: str, complexity_l
             requirements=["Design an appropriate database schema"],
             db_technology=db_technology,
             complexity_level=complexity_level,
-            skills_tested=[db_technology, "Database Design"],
-            scenario=fallback_context,
-            task_description=fallback_task,
-            expected_deliverable=fallback_outcome,
-            context=fallback_context
+            skills_tested=[db_technology, "Database Design"]
         )
 
 
@@ -798,7 +779,7 @@ def generate_db_schema_question(state: CodingInterviewState, question_number: in
     difficulty_desc = get_difficulty_description(difficulty)
 
     # Determine database technology
-    db_technology = skill_name if skill_name.upper() in ['SQL', 'MONGODB', 'POSTGRESQL', 'MYSQL', 'NOSQL'] else "SQL"
+    db_technology = skill_name if skill_name.upper() in DB_SCHEMA_TECHNOLOGIES else "SQL"
 
     # Get complexity level from job skill analysis
     complexity_level = "intermediate"
@@ -823,10 +804,9 @@ Create an appropriate database challenge.
         complexity_level=complexity_level
     )
 
-    # Generate using LLM
-    llm = get_llm()
-    response = llm.invoke(formatted_prompt)
-    db_schema_data = parse_db_schema_response(response.content, db_technology, complexity_level)
+    # Generate using LLM (or reuse the response to an identical prompt)
+    response_text = generate_question_text(formatted_prompt, state.question_cache_dir)
+    db_schema_data = parse_db_schema_response(response_text, db_technology, complexity_level)
 
     return InterviewQuestion(
         question_id=question_number,  # FIXED: Use question_number instead of state.current_question_count + 1
@@ -851,7 +831,7 @@ def generate_explanation_question(state: CodingInterviewState, question_number:
     difficulty_desc = get_difficulty_description(difficulty)
 
     # Determine question parameters
-    target_language = skill_name if skill_name in ['Python', 'JavaScript', 'Java', 'C#', 'Go', 'Rust', 'TypeScript'] else "Python"
+    target_language = skill_name if skill_name in CODING_LANGUAGES else "Python"
     cv_technology = skill_name
 
     # Get explanation prompt template
@@ -872,10 +852,9 @@ Create realistic working code they might encounter in their role.
         difficulty_description=difficulty_desc
     )
 
-    # Generate using LLM
-    llm = get_llm()
-    response = llm.invoke(formatted_prompt)
-    explanation_data = parse_explanation_response(response.content, target_language, cv_technology)
+    # Generate using LLM (or reuse the response to an identical prompt)
+    response_text = generate_question_text(formatted_prompt, state.question_cache_dir)
+    explanation_data = parse_explanation_response(response_text, target_language, cv_technology)
 
     return InterviewQuestion(
         question_id=question_number,  # FIXED: Use question_number instead of state.current_question_count + 1
@@ -915,71 +894,75 @@ def generate_coding_question(state: CodingInterviewState, question_number: int)
         return generate_debug_question(state, question_number)
 
 
+def _fallback_coding_question(question_number: int) -> InterviewQuestion:
+    """Placeholder debug question used when generating a question fails"""
+    return InterviewQuestion(
+        question_id=question_number,
+        question_type="coding_debug",
+        question_text=f"Fallback Question {question_number}",
+        difficulty_level=5,
+        technology_focus="Python",
+        debug_data=DebugCodingQuestion(
+            title=f"Fallback Debug Question {question_number}",
+            context_paragraph="This is a fallback question due to generation error.",
+            task_instruction="Debug the code below.",
+            expected_outcome="Code should run without errors.",
+            expected_output="",
+            buggy_code="# Fallback code\nprint('Hello World')",
+            error_count=1,
+            error_types=["logic"],
+            hints=[],
+            target_language="Python",
+            cv_technology="Python"
+        ),
+        timestamp=datetime.now().isoformat()
+    )
+
+
 def generate_all_coding_questions(state: CodingInterviewState) -> List[InterviewQuestion]:
+    """Synchronous wrapper around agenerate_all_coding_questions()"""
+    return asyncio.run(agenerate_all_coding_questions(state))
+
+
+async def agenerate_all_coding_questions(state: CodingInterviewState) -> List[InterviewQuestion]:
     """
     Generate all coding questions upfront based on distribution plan
 
     This function generates all questions at once at the start of the interview,
     eliminating the need for sequential generation during the interview flow.
+    Questions only depend on the plan, so their LLM calls run concurrently
+    (at most QUESTION_GENERATION_CONCURRENCY at a time).
 
     Args:
         state: CodingInterviewState with job analysis and question distribution plan
 
     Returns:
-        List of InterviewQuestion objects (5 questions)
+        List of InterviewQuestion objects (5 questions), in question order
     """
-    import time  # For rate limiting
-
     print("\n" + "="*70)
     print("🚀 GENERATING ALL CODING QUESTIONS UPFRONT")
     print("="*70)
 
-    all_questions = []
-
-    for question_number in range(1, state.total_questions + 1):
-        # Add rate limiting delay between LLM calls (except for first question)
-        if question_number > 1:
-            print(f"\n⏳ Rate limiting delay (300ms)...")
-            time.sleep(0.3)
-
-        try:
-            # Generate question using existing function
-            question = generate_coding_question(state, question_number)
-            all_questions.append(question)
-
-            print(f"✅ Q{question_number} generated successfully")
-
-        except Exception as e:
-            print(f"❌ Error generating Q{question_number}: {e}")
-            # Create fallback question
-            fallback_question = InterviewQuestion(
-                question_id=question_number,
-                question_type="coding_debug",
-                question_text=f"Fallback Question {question_number}",
-                difficulty_level=5,
-                technology_focus="Python",
-                debug_data=DebugCodingQuestion(
-                    title=f"Fallback Debug Question {question_number}",
-                    context_paragraph="This is a fallback question due to generation error.",
-                    task_instruction="Debug the code below.",
-                    expected_outcome="Code should run without errors.",
-                    expected_output="",
-                    buggy_code="# Fallback code\nprint('Hello World')",
-                    error_count=1,
-                    error_types=["logic"],
-                    hints=[],
-                    target_language="Python",
-                    cv_technology="Python",
-                    description="Fallback question",
-                    expected_behavior="Should work",
-                    context="Fallback context"
-                ),
-                timestamp=datetime.now().isoformat()
-            )
-            all_questions.append(fallback_question)
+    # Bounds concurrent LLM calls (replaces the fixed delay between sequential calls)
+    question_slots = asyncio.Semaphore(max(1, QUESTION_GENERATION_CONCURRENCY))
+
+    async def _generate(question_number: int) -> InterviewQuestion:
+        async with question_slots:
+            try:
+                # Generate question using existing function
+                question = await asyncio.to_thread(generate_coding_question, state, question_number)
+                print(f"✅ Q{question_number} generated successfully")
+                return question
+            except Exception as e:
+                print(f"❌ Error generating Q{question_number}: {e}")
+                return _fallback_coding_question(question_number)
+
+    all_questions = await asyncio.gather(
+        *(_generate(question_number) for question_number in range(1, state.total_questions + 1))
+    )
 
     print("\n" + "="*70)
     print(f"✅ ALL {len(all_questions)} QUESTIONS GENERATED SUCCESSFULLY")
     print("="*70 + "\n")
 
-    return all_questions
\ No newline at end of file
+    return list(all_questions)
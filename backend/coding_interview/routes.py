@@ -7,7 +7,6 @@ from flask import Blueprint, request, jsonify
 from datetime import datetime
 import json
 import os
-import re
 
 # Import from shared modules
 from shared.llm_setup import get_llm
@@ -20,8 +19,9 @@ from .question_generator import (
     build_skill_difficulty_map,
     create_question_distribution_plan
 )
-from .job_skill_analyzer import analyze_job_description_skills, save_skill_analysis
-from .evaluator.engine import evaluate_coding_interview
+from .job_skill_analyzer import analyze_job_description_skills, save_skill_analysis, SKILL_CACHE_DIRNAME
+from .question_cache import QUESTION_CACHE_DIRNAME
+from .utils import parse_coding_response, append_coding_response, fold_coding_response_log
 
 
 # Create Blueprint
@@ -102,10 +102,12 @@ def initialize_coding_interview(job_description: str) -> CodingInterviewState:
     print("="*60)
 
     # Analyze job description to extract and rank skills
-    job_skill_analysis = analyze_job_description_skills(job_description, llm)
+    upload_folder = get_upload_folder()
+    job_skill_analysis = analyze_job_description_skills(
+        job_description, llm, cache_dir=os.path.join(upload_folder, SKILL_CACHE_DIRNAME)
+    )
 
     # Save structured skill analysis to JSON
-    upload_folder = get_upload_folder()
     skills_output_path = os.path.join(upload_folder, 'structured_skills.json')
     save_skill_analysis(job_skill_analysis, skills_output_path)
 
@@ -183,35 +185,23 @@ def initialize_coding_interview(job_description: str) -> CodingInterviewState:
         # Job-centric fields
         job_skill_analysis=job_skill_analysis,
         question_distribution=question_distribution,
-        skill_difficulty_map=skill_difficulty_map
+        skill_difficulty_map=skill_difficulty_map,
+        question_cache_dir=os.path.join(get_interviews_folder(), QUESTION_CACHE_DIRNAME)
     )
 
 
 def save_coding_response(filename: str, current_question: InterviewQuestion, response_text: str, candidate_name: str = "Candidate"):
     """
-    Save coding question and response to structured JSON file.
+    Save coding question and response to the session's append-only response log.
+
+    Each call appends one line, so saving does not re-read or rewrite earlier
+    answers. The log is folded into the structured JSON file when the last
+    question is submitted, when evaluation starts, or by the evaluator itself.
     """
     try:
         interviews_folder = get_interviews_folder()
         filepath = os.path.join(interviews_folder, filename)
 
-        # Load existing data for this coding test session (if any)
-        coding_data = {}
-        try:
-            with open(filepath, 'r') as f:
-                coding_data = json.load(f)
-        except FileNotFoundError:
-            # First question - create new file structure
-            coding_data = {
-                "candidate_name": candidate_name,
-                "interview_date": datetime.now().strftime('%d-%m-%Y'),
-                "questions": []
-            }
-
-        # Ensure questions array exists
-        if "questions" not in coding_data:
-            coding_data["questions"] = []
-
         # Extract question details based on question type
         question_title = ""
         technology = ""
@@ -231,46 +221,9 @@ def save_coding_response(filename: str, current_question: InterviewQuestion, res
             expected_output = ""  # Database questions don't have expected output
 
         # Parse candidate response to extract code and explanation
-        candidate_code = ""
-        candidate_explanation = ""
-
-        # Try to split by common delimiters
-        if "FIXED CODE:" in response_text.upper():
-            parts = re.split(r'(?i)FIXED CODE:\s*', response_text, maxsplit=1)
-            if len(parts) > 1:
-                remaining = parts[1]
-                # Look for EXPLANATION section
-                expl_parts = re.split(r'(?i)EXPLANATION:\s*', remaining, maxsplit=1)
-                if len(expl_parts) > 1:
-                    candidate_code = expl_parts[0].strip()
-                    candidate_explanation = expl_parts[1].strip()
-                else:
-                    candidate_code = remaining.strip()
-        elif "CODE:" in response_text.upper():
-            parts = re.split(r'(?i)CODE:\s*', response_text, maxsplit=1)
-            if len(parts) > 1:
-                remaining = parts[1]
-                expl_parts = re.split(r'(?i)EXPLANATION:\s*', remaining, maxsplit=1)
-                if len(expl_parts) > 1:
-                    candidate_code = expl_parts[0].strip()
-                    candidate_explanation = expl_parts[1].strip()
-                else:
-                    candidate_code = remaining.strip()
-        else:
-            # No clear code/explanation split, use heuristics
-            # If response contains code blocks, extract them
-            code_blocks = re.findall(r'```[\w]*\n(.*?)```', response_text, re.DOTALL)
-            if code_blocks:
-                candidate_code = code_blocks[0].strip()
-                # Everything else is explanation
-                candidate_explanation = re.sub(r'```[\w]*\n.*?```', '', response_text, flags=re.DOTALL).strip()
-            else:
-                # For explanation questions, entire response is the explanation
-                if current_question.question_type == 'coding_explain':
-                    candidate_explanation = response_text.strip()
-                else:
-                    # For other types, assume entire response is code
-                    candidate_code = response_text.strip()
+        parsed = parse_coding_response(response_text, current_question.question_type)
+        candidate_code = parsed['code']
+        candidate_explanation = parsed['explanation']
 
         # Create question entry
         question_entry = {
@@ -284,27 +237,10 @@ def save_coding_response(filename: str, current_question: InterviewQuestion, res
             "candidate_full_response": response_text
         }
 
-        # Update existing question or append new one (prevents duplicates when re-submitting)
-        existing_index = next(
-            (i for i, q in enumerate(coding_data["questions"])
-             if q.get("question_id") == current_question.question_id),
-            None
-        )
-
-        if existing_index is not None:
-            # Update existing entry (user re-submitted same question)
-            coding_data["questions"][existing_index] = question_entry
-            print(f"✏️  Updated existing Q{current_question.question_id}")
-        else:
-            # New question - append
-            coding_data["questions"].append(question_entry)
-            print(f"➕ Added new Q{current_question.question_id}")
-
-        # Write back to file
-        with open(filepath, 'w') as f:
-            json.dump(coding_data, f, indent=2)
+        # Append to the response log (folded into the JSON file later)
+        log_path = append_coding_response(filepath, question_entry, candidate_name)
 
-        print(f"✅ Coding response saved to: {filepath}")
+        print(f"✅ Coding response saved to: {log_path}")
         print(f"   Question {current_question.question_id}: {question_title}")
         print(f"   Technology: {technology}")
         print(f"   Expected Output: {expected_output or '(none)'}")
@@ -312,6 +248,16 @@ def save_coding_response(filename: str, current_question: InterviewQuestion, res
         print(f"❌ Error saving coding response: {e}")
 
 
+def finalize_coding_session(filename: str) -> None:
+    """
+    Fold the session's response log into the structured coding test JSON file.
+
+    Args:
+        filename: Coding test filename (e.g., "code-test-2025-01-21-101500.json")
+    """
+    fold_coding_response_log(os.path.join(get_interviews_folder(), filename))
+
+
 # ============================================================================
 # ROUTES
 # ============================================================================
@@ -607,6 +553,11 @@ def submit_coding_response():
         else:
             print("❌ ERROR: No question object available to save!")
 
+        # Last question answered - write the coding test file now so it exists
+        # even if the interview is never evaluated through /coding/evaluate
+        if int(question_number) >= state.total_questions:
+            finalize_coding_session(state.coding_test_filename)
+
         print(f"Question {question_number} response saved: {response_text[:100]}...")
 
         # Return simple success response - NO question generation
@@ -688,6 +639,12 @@ def evaluate_coding_interview_route():
         if not coding_test_filename:
             return jsonify({'error': 'No coding_test_filename provided'}), 400
 
+        # Fold the response log into the coding test file the evaluator reads
+        finalize_coding_session(coding_test_filename)
+
+        # Evaluator (and its Piston HTTP client) is only loaded once an evaluation is requested
+        from .evaluator.engine import evaluate_coding_interview
+
         # Run evaluation
         upload_folder = get_upload_folder()
         interviews_folder = get_interviews_folder()
@@ -471,10 +471,7 @@ if __name__ == "__main__":
         error_types=["logic"],
         hints=[],
         target_language="Python",
-        cv_technology="Python",
-        description="Fix the addition",
-        expected_behavior="Should return 8",
-        context="Basic Python"
+        cv_technology="Python"
     )
 
     sample_question = InterviewQuestion(
@@ -5,10 +5,19 @@ Helper functions for response parsing, validation, and formatting
 
 import re
 import json
+import os
+import threading
 from typing import Dict, Any, Tuple, Optional
 from datetime import datetime
 
 
+# Compiled once at import: responses are parsed on every submit and again when saving
+_FIXED_CODE_RE = re.compile(r'FIXED CODE:\s*', re.IGNORECASE)
+_CODE_RE = re.compile(r'CODE:\s*', re.IGNORECASE)
+_EXPLANATION_RE = re.compile(r'EXPLANATION:\s*', re.IGNORECASE)
+_CODE_BLOCK_RE = re.compile(r'```[\w]*\n(.*?)```', re.DOTALL)
+
+
 def parse_coding_response(response_text: str, question_type: str) -> Dict[str, str]:
     """
     Parse candidate code and explanation from response text
@@ -24,22 +33,16 @@ def parse_coding_response(response_text: str, question_type: str) -> Dict[str, s
     candidate_explanation = ""
 
     # Try to split by common delimiters
-    if "FIXED CODE:" in response_text.upper():
-        parts = re.split(r'(?i)FIXED CODE:\s*', response_text, maxsplit=1)
-        if len(parts) > 1:
-            remaining = parts[1]
-            expl_parts = re.split(r'(?i)EXPLANATION:\s*', remaining, maxsplit=1)
-            if len(expl_parts) > 1:
-                candidate_code = expl_parts[0].strip()
-                candidate_explanation = expl_parts[1].strip()
-            else:
-                candidate_code = remaining.strip()
-
-    elif "CODE:" in response_text.upper():
-        parts = re.split(r'(?i)CODE:\s*', response_text, maxsplit=1)
+    # (upper() + "in" is a cheaper pre-check than a case-insensitive regex search)
+    upper_text = response_text.upper()
+    if "CODE:" in upper_text:
+        # "FIXED CODE:" contains "CODE:", so it is only tried when "CODE:" is present
+        parts = _FIXED_CODE_RE.split(response_text, maxsplit=1) if "FIXED CODE:" in upper_text else [response_text]
+        if len(parts) == 1:
+            parts = _CODE_RE.split(response_text, maxsplit=1)
         if len(parts) > 1:
             remaining = parts[1]
-            expl_parts = re.split(r'(?i)EXPLANATION:\s*', remaining, maxsplit=1)
+            expl_parts = _EXPLANATION_RE.split(remaining, maxsplit=1)
             if len(expl_parts) > 1:
                 candidate_code = expl_parts[0].strip()
                 candidate_explanation = expl_parts[1].strip()
@@ -48,10 +51,17 @@ def parse_coding_response(response_text: str, question_type: str) -> Dict[str, s
 
     else:
         # No clear code/explanation split, use heuristics
-        code_blocks = re.findall(r'```[\w]*\n(.*?)```', response_text, re.DOTALL)
+        code_blocks = list(_CODE_BLOCK_RE.finditer(response_text))
         if code_blocks:
-            candidate_code = code_blocks[0].strip()
-            candidate_explanation = re.sub(r'```[\w]*\n.*?```', '', response_text, flags=re.DOTALL).strip()
+            candidate_code = code_blocks[0].group(1).strip()
+            # Everything outside the code blocks is explanation
+            pieces = []
+            pos = 0
+            for block in code_blocks:
+                pieces.append(response_text[pos:block.start()])
+                pos = block.end()
+            pieces.append(response_text[pos:])
+            candidate_explanation = ''.join(pieces).strip()
         else:
             # For explanation questions, entire response is the explanation
             if question_type == 'coding_explain':
@@ -76,8 +86,7 @@ def extract_code_blocks(text: str) -> list:
     Returns:
         List of code block strings
     """
-    code_blocks = re.findall(r'```[\w]*\n(.*?)```', text, re.DOTALL)
-    return [block.strip() for block in code_blocks]
+    return [block.strip() for block in _CODE_BLOCK_RE.findall(text)]
 
 
 def validate_coding_session(session_data: Dict[str, Any]) -> bool:
@@ -251,3 +260,119 @@ def save_json_file(data: Dict[str, Any], filepath: str) -> bool:
     except Exception as e:
         print(f"❌ Error saving to {filepath}: {e}")
         return False
+
+
+# Answers are appended to "<coding test file>.responses.ndjson" while the interview runs;
+# fold_coding_response_log() turns them into the coding test JSON file
+# (distinct from the evaluator's "<evaluation file>.ndjson" progress file)
+CODING_LOG_SUFFIX = '.responses.ndjson'
+
+# A log being folded is renamed to "<log>.folding" first, so answers appended
+# during a fold start a new log instead of being removed with the old one
+_FOLDING_SUFFIX = '.folding'
+
+# Serializes appends and folds between the server's request threads
+_response_log_lock = threading.Lock()
+
+
+def append_coding_response(filepath: str, question_entry: Dict[str, Any], candidate_name: str = "Candidate") -> str:
+    """
+    Append one answer to a coding test's response log
+
+    Args:
+        filepath: Path of the coding test JSON file (the log is filepath + CODING_LOG_SUFFIX)
+        question_entry: Structured question/answer entry (must include 'question_id')
+        candidate_name: Candidate name, recorded when the log is started
+
+    Returns:
+        Path of the response log
+    """
+    log_path = filepath + CODING_LOG_SUFFIX
+    with _response_log_lock, open(log_path, 'a', encoding='utf-8') as f:
+        if f.tell() == 0:
+            # First answer in this log - start it with the session details
+            f.write(json.dumps({
+                "candidate_name": candidate_name,
+                "interview_date": datetime.now().strftime('%d-%m-%Y')
+            }, ensure_ascii=False) + '\n')
+        # A re-submission is a later entry for the same question_id
+        f.write(json.dumps({
+            "question_id": question_entry["question_id"],
+            "entry": question_entry
+        }, ensure_ascii=False) + '\n')
+    return log_path
+
+
+def fold_coding_response_log(filepath: str) -> bool:
+    """
+    Fold a coding test's response log into its structured JSON file
+
+    Later log entries for a question replace earlier ones (re-submissions), and
+    questions already in the JSON file keep their position. The folded log is
+    removed once the JSON file has been written.
+
+    Args:
+        filepath: Path of the coding test JSON file (the log is filepath + CODING_LOG_SUFFIX)
+
+    Returns:
+        True if a log was folded, False if there was none or folding failed
+    """
+    log_path = filepath + CODING_LOG_SUFFIX
+    folding_path = log_path + _FOLDING_SUFFIX
+    folded = False
+
+    with _response_log_lock:
+        try:
+            while True:
+                # A ".folding" file left by an interrupted fold is folded first
+                if not os.path.exists(folding_path):
+                    if not os.path.exists(log_path):
+                        break
+                    os.replace(log_path, folding_path)
+
+                _fold_log_file(filepath, folding_path)
+                os.remove(folding_path)
+                folded = True
+        except Exception as e:
+            print(f"❌ Error folding response log {log_path}: {e}")
+
+    return folded
+
+
+def _fold_log_file(filepath: str, log_path: str) -> None:
+    """Apply one response log file to the coding test JSON file (atomic write)"""
+    # Start from the existing file (if any) so earlier folded answers are kept
+    coding_data = {}
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            coding_data = json.load(f)
+    except FileNotFoundError:
+        pass
+
+    questions = {q.get("question_id"): q for q in coding_data.get("questions", [])}
+
+    with open(log_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash mid-write
+                print(f"⚠️  Skipping unreadable line in {log_path}")
+                continue
+            if "entry" in record:
+                questions[record["question_id"]] = record["entry"]
+            else:
+                coding_data.setdefault("candidate_name", record.get("candidate_name", "Candidate"))
+                coding_data.setdefault("interview_date", record.get("interview_date", datetime.now().strftime('%d-%m-%Y')))
+
+    coding_data["questions"] = list(questions.values())
+
+    # Write to a temp file first so readers never see a partial file
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(coding_data, f, indent=2)
+    os.replace(tmp_path, filepath)
+
+    print(f"✅ Coding responses folded into: {filepath} ({len(coding_data['questions'])} questions)")
@@ -8,12 +8,22 @@ from flask import Flask, jsonify, redirect, request
 from flask_cors import CORS
 import os
 import json
+import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), 'config', '.env'))
 
+# Diagnostics from coding_interview modules using logging (e.g. the evaluator); LOG_LEVEL=DEBUG shows score caps.
+# Only that logger hierarchy is configured, so third-party INFO records stay off the console.
+_coding_log_handler = logging.StreamHandler()
+_coding_log_handler.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+_coding_logger = logging.getLogger('coding_interview')
+_coding_logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+_coding_logger.addHandler(_coding_log_handler)
+_coding_logger.propagate = False
+
 # Verify API key
 api_key = os.getenv("GOOGLE_API_KEY")
 if not api_key:
@@ -9,6 +9,7 @@ It handles:
 """
 
 import os
+import threading
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from typing import Optional
@@ -17,6 +18,9 @@ from typing import Optional
 # Global LLM instance (lazy initialization)
 _llm_instance: Optional[ChatGoogleGenerativeAI] = None
 
+# Guards creation of _llm_instance when worker threads call get_llm() concurrently
+_llm_lock = threading.Lock()
+
 
 def load_env() -> None:
     """
@@ -80,22 +84,27 @@ def get_llm(model: str = "gemini-2.0-flash", temperature: float = 0.3,
     if _llm_instance is not None and not force_new:
         return _llm_instance
 
-    # Validate API key
-    validate_api_key()
+    with _llm_lock:
+        # Another thread may have created the instance while we waited
+        if _llm_instance is not None and not force_new:
+            return _llm_instance
+
+        # Validate API key
+        validate_api_key()
 
-    # Create LLM instance
-    llm_kwargs = {
-        "model": model,
-        "temperature": temperature,
-    }
+        # Create LLM instance
+        llm_kwargs = {
+            "model": model,
+            "temperature": temperature,
+        }
 
-    if max_tokens is not None:
-        llm_kwargs["max_tokens"] = max_tokens
+        if max_tokens is not None:
+            llm_kwargs["max_tokens"] = max_tokens
 
-    _llm_instance = ChatGoogleGenerativeAI(**llm_kwargs)
-    print(f"✅ LLM initialized: {model} (temp={temperature})")
+        _llm_instance = ChatGoogleGenerativeAI(**llm_kwargs)
+        print(f"✅ LLM initialized: {model} (temp={temperature})")
 
-    return _llm_instance
+        return _llm_instance
 
 
 def initialize_llm(model: str = "gemini-2.0-flash", temperature: float = 0.3,